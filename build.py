@@ -77,10 +77,28 @@ def build_executable(build_dir):
         "--hidden-import=psutil",
         "--hidden-import=winshell",
         "--hidden-import=win32com",
-        "--collect-all=PyQt5",
-        "src/main.py"
+        # No --collect-all=PyQt5: the PyQt5 hooks already bundle the Qt
+        # modules the application imports and the plugins they need
+        # Standard library modules the application never imports
+        "--exclude-module=tkinter",
+        "--exclude-module=unittest",
+        "--exclude-module=pydoc",
+        # Bytecode without docstrings/asserts: smaller and faster to import
+        "--optimize=2",
     ]
     
+    # Strip debug symbols from bundled binaries on request only: PyInstaller
+    # advises against it on Windows, where a MinGW strip is often on PATH
+    if os.environ.get("STRIP_BINARIES") == "1" and shutil.which("strip"):
+        cmd.append("--strip")
+    
+    # Compress binaries with UPX when its location is provided
+    upx_dir = os.environ.get("UPX_DIR")
+    if upx_dir:
+        cmd.append(f"--upx-dir={upx_dir}")
+    
+    cmd.append("src/main.py")
+    
     print(f"Running: {' '.join(cmd)}\n")
     
     try:
@@ -0,0 +1,213 @@
+"""
+Bulk registry enumeration through advapi32.
+Each parent key is opened once and every name is read into a single reused
+buffer, without a winreg call (and end-of-enumeration exception) per item.
+Falls back to winreg when advapi32 cannot be loaded.
+"""
+import ctypes
+from typing import List, Tuple
+
+try:
+    import winreg  # type: ignore
+except ImportError:
+    winreg = None
+
+try:
+    from ctypes import wintypes
+
+    _advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+except (AttributeError, OSError, ValueError):
+    _advapi32 = None
+
+ERROR_SUCCESS = 0
+ERROR_MORE_DATA = 234
+ERROR_NO_MORE_ITEMS = 259
+
+KEY_READ = 0x20019
+
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+REG_DWORD = 4
+REG_MULTI_SZ = 7
+REG_QWORD = 11
+
+if _advapi32 is not None:
+    _LPDWORD = ctypes.POINTER(wintypes.DWORD)
+
+    _RegOpenKeyExW = _advapi32.RegOpenKeyExW
+    _RegOpenKeyExW.argtypes = [
+        wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+        ctypes.POINTER(wintypes.HKEY),
+    ]
+    _RegOpenKeyExW.restype = wintypes.LONG
+
+    _RegCloseKey = _advapi32.RegCloseKey
+    _RegCloseKey.argtypes = [wintypes.HKEY]
+    _RegCloseKey.restype = wintypes.LONG
+
+    _RegQueryInfoKeyW = _advapi32.RegQueryInfoKeyW
+    _RegQueryInfoKeyW.argtypes = [
+        wintypes.HKEY, wintypes.LPWSTR, _LPDWORD, _LPDWORD,
+        _LPDWORD, _LPDWORD, _LPDWORD,
+        _LPDWORD, _LPDWORD, _LPDWORD,
+        _LPDWORD, ctypes.c_void_p,
+    ]
+    _RegQueryInfoKeyW.restype = wintypes.LONG
+
+    _RegEnumKeyExW = _advapi32.RegEnumKeyExW
+    _RegEnumKeyExW.argtypes = [
+        wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, _LPDWORD,
+        _LPDWORD, wintypes.LPWSTR, _LPDWORD, ctypes.c_void_p,
+    ]
+    _RegEnumKeyExW.restype = wintypes.LONG
+
+    _RegEnumValueW = _advapi32.RegEnumValueW
+    _RegEnumValueW.argtypes = [
+        wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, _LPDWORD,
+        _LPDWORD, _LPDWORD, ctypes.c_void_p, _LPDWORD,
+    ]
+    _RegEnumValueW.restype = wintypes.LONG
+
+
+def _open_key(hkey: int, path: str, access: int):
+    """Open a key, raising OSError like winreg.OpenKey"""
+    handle = wintypes.HKEY()
+    status = _RegOpenKeyExW(hkey, path, 0, access, ctypes.byref(handle))
+    if status != ERROR_SUCCESS:
+        raise ctypes.WinError(status)
+    return handle
+
+
+def _query_info(handle) -> Tuple[int, int, int, int, int]:
+    """Return (subkeys, max subkey len, values, max value name len, max data len)"""
+    subkeys = wintypes.DWORD()
+    max_subkey_len = wintypes.DWORD()
+    values = wintypes.DWORD()
+    max_value_name_len = wintypes.DWORD()
+    max_value_len = wintypes.DWORD()
+    status = _RegQueryInfoKeyW(
+        handle, None, None, None,
+        ctypes.byref(subkeys), ctypes.byref(max_subkey_len), None,
+        ctypes.byref(values), ctypes.byref(max_value_name_len), ctypes.byref(max_value_len),
+        None, None,
+    )
+    if status != ERROR_SUCCESS:
+        raise ctypes.WinError(status)
+    return (
+        subkeys.value, max_subkey_len.value,
+        values.value, max_value_name_len.value, max_value_len.value,
+    )
+
+
+def _decode_value(value_type: int, raw: bytes):
+    """Convert raw value data the way winreg.EnumValue does"""
+    if value_type in (REG_SZ, REG_EXPAND_SZ):
+        return raw.decode("utf-16-le", "ignore").split("\0", 1)[0]
+    if value_type == REG_MULTI_SZ:
+        text = raw.decode("utf-16-le", "ignore").rstrip("\0")
+        return text.split("\0") if text else []
+    if value_type == REG_DWORD and len(raw) >= 4:
+        return int.from_bytes(raw[:4], "little")
+    if value_type == REG_QWORD and len(raw) >= 8:
+        return int.from_bytes(raw[:8], "little")
+    return raw or None
+
+
+def enum_subkeys(hkey: int, path: str, access: int = KEY_READ) -> List[str]:
+    """
+    List the names of all subkeys of a key
+
+    Args:
+        access: Access mask for opening the key, e.g. with a WOW64 view flag
+
+    Raises:
+        OSError: If the key cannot be opened
+    """
+    if _advapi32 is None:
+        with winreg.OpenKey(hkey, path, 0, access) as key:
+            names = []
+            for index in range(winreg.QueryInfoKey(key)[0]):
+                try:
+                    names.append(winreg.EnumKey(key, index))
+                except OSError:
+                    break
+            return names
+
+    handle = _open_key(hkey, path, access)
+    try:
+        count, max_len, _, _, _ = _query_info(handle)
+        buffer_len = max_len + 1
+        buffer = ctypes.create_unicode_buffer(buffer_len)
+        size = wintypes.DWORD()
+        names = []
+        index = 0
+        while index < count:
+            size.value = buffer_len
+            status = _RegEnumKeyExW(handle, index, buffer, ctypes.byref(size), None, None, None, None)
+            if status == ERROR_MORE_DATA:
+                # A longer name was added since the info query; grow and retry
+                buffer_len *= 2
+                buffer = ctypes.create_unicode_buffer(buffer_len)
+                continue
+            if status != ERROR_SUCCESS:
+                break
+            names.append(buffer.value)
+            index += 1
+        return names
+    finally:
+        _RegCloseKey(handle)
+
+
+def enum_values(hkey: int, path: str, access: int = KEY_READ) -> List[Tuple[str, object, int]]:
+    """
+    List all values of a key as (name, data, type), like winreg.EnumValue
+
+    Args:
+        access: Access mask for opening the key, e.g. with a WOW64 view flag
+
+    Raises:
+        OSError: If the key cannot be opened
+    """
+    if _advapi32 is None:
+        with winreg.OpenKey(hkey, path, 0, access) as key:
+            values = []
+            for index in range(winreg.QueryInfoKey(key)[1]):
+                try:
+                    values.append(winreg.EnumValue(key, index))
+                except OSError:
+                    break
+            return values
+
+    handle = _open_key(hkey, path, access)
+    try:
+        _, _, count, max_name_len, max_data_len = _query_info(handle)
+        name_len = max_name_len + 1
+        data_len = max(max_data_len, 1)
+        name_buffer = ctypes.create_unicode_buffer(name_len)
+        data_buffer = ctypes.create_string_buffer(data_len)
+        name_size = wintypes.DWORD()
+        data_size = wintypes.DWORD()
+        value_type = wintypes.DWORD()
+        values = []
+        index = 0
+        while index < count:
+            name_size.value = name_len
+            data_size.value = data_len
+            status = _RegEnumValueW(
+                handle, index, name_buffer, ctypes.byref(name_size), None,
+                ctypes.byref(value_type), data_buffer, ctypes.byref(data_size),
+            )
+            if status == ERROR_MORE_DATA:
+                name_len *= 2
+                data_len *= 2
+                name_buffer = ctypes.create_unicode_buffer(name_len)
+                data_buffer = ctypes.create_string_buffer(data_len)
+                continue
+            if status != ERROR_SUCCESS:
+                break
+            raw = data_buffer.raw[:data_size.value]
+            values.append((name_buffer.value, _decode_value(value_type.value, raw), value_type.value))
+            index += 1
+        return values
+    finally:
+        _RegCloseKey(handle)
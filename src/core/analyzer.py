@@ -1,21 +1,17 @@
 """
 Disk analyzer - Analyze disk usage and find large files
 """
+import heapq
 import os
-from typing import List, Dict, Tuple
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import deque
+from operator import attrgetter, itemgetter
 from utils.scanner import Scanner, FileInfo
 
 
-@dataclass
-class LargestItem:
-    """Information about a large file or folder"""
-    path: str
-    size: int
-    is_directory: bool
-
-
 @dataclass
 class DiskItem:
     """Disk item for tree view"""
@@ -42,63 +38,94 @@ class DiskAnalysis:
 class DiskAnalyzer:
     """Analyze disk usage"""
     
+    # Fan out the tree scan only when the root has more subdirectories than this
+    PARALLEL_MIN_SUBDIRS = 4
+    
     def __init__(self, excluded_paths: List[str] = None):
         """Initialize disk analyzer"""
         self.scanner = Scanner(excluded_paths)
     
-    def analyze_directory(self, path: str, top_n: int = 10) -> DiskAnalysis:
+    def analyze_full(self, path: str, top_n: int = 10, min_size_mb: int = 0) -> DiskAnalysis:
         """
-        Analyze disk usage for a directory
+        Analyze disk usage for a directory in a single pass
+        
+        Totals, folder sizes, file type distribution and the largest files
+        are all accumulated during one scan, so callers that need several of
+        them should use this instead of the individual helpers.
         
         Args:
             path: Directory path to analyze
             top_n: Number of top items to return
+            min_size_mb: Minimum size in MB for a file to be listed as largest
         
         Returns:
             DiskAnalysis object
         """
-        # Scan all files
-        files = self.scanner.scan_directory(path, recursive=True)
+        min_size_bytes = min_size_mb * 1024 * 1024
+        # Structure-of-arrays scan: the numeric passes run over flat columns
+        # (sum and the top-N selection then work in C), and FileInfos are
+        # only built for the largest files
+        paths, sizes, mtimes_ns = self.scanner.scan_directory_soa(path, recursive=True)
+        total_size = sum(sizes)
+        
+        folder_sizes = {}
+        file_types = {}
         
-        # Calculate folder sizes
-        folder_sizes = defaultdict(int)
-        file_types = defaultdict(int)
-        folder_count = 0
+        # Hot loop: bind frequently used callables to locals
+        split_path = os.path.split
+        splitext = os.path.splitext
+        folder_get = folder_sizes.get
+        type_get = file_types.get
+        # Few distinct extensions across many files: normalize each raw one once
+        ext_cache = {'': sys.intern('[no extension]')}
         
-        for file_info in files:
+        for file_path, size in zip(paths, sizes):
             # Add to folder size
-            folder = os.path.dirname(file_info.path)
-            folder_sizes[folder] += file_info.size
+            folder, name = split_path(file_path)
+            folder_sizes[folder] = folder_get(folder, 0) + size
             
-            # Track file types
-            ext = os.path.splitext(file_info.path)[1].lower()
-            if ext:
-                file_types[ext] += file_info.size
-            else:
-                file_types['[no extension]'] += file_info.size
-        
-        # Count unique folders
-        folder_count = len(folder_sizes)
+            # Track file types (the extension only depends on the file name)
+            raw_ext = splitext(name)[1]
+            ext = ext_cache.get(raw_ext)
+            if ext is None:
+                ext = ext_cache[raw_ext] = sys.intern(raw_ext.lower())
+            file_types[ext] = type_get(ext, 0) + size
         
-        # Get largest files
-        largest_files = sorted(files, key=lambda f: f.size, reverse=True)[:top_n]
+        # Get largest files: select indices by size, then map back to FileInfo
+        largest_files = []
+        if top_n > 0:
+            if min_size_bytes > 0:
+                candidates = [i for i, size in enumerate(sizes) if size >= min_size_bytes]
+            else:
+                candidates = range(len(sizes))
+            largest = heapq.nlargest(top_n, candidates, key=sizes.__getitem__)
+            largest_files = [FileInfo(paths[i], sizes[i], mtimes_ns[i]) for i in largest]
         
         # Get largest folders
-        largest_folders = sorted(
-            folder_sizes.items(),
-            key=lambda item: item[1],
-            reverse=True
-        )[:top_n]
+        largest_folders = heapq.nlargest(top_n, folder_sizes.items(), key=itemgetter(1))
         
         return DiskAnalysis(
-            total_size=sum(f.size for f in files),
-            file_count=len(files),
-            folder_count=folder_count,
+            total_size=total_size,
+            file_count=len(paths),
+            folder_count=len(folder_sizes),
             largest_files=largest_files,
             largest_folders=largest_folders,
-            file_type_distribution=dict(file_types)
+            file_type_distribution=file_types
         )
     
+    def analyze_directory(self, path: str, top_n: int = 10) -> DiskAnalysis:
+        """
+        Analyze disk usage for a directory
+        
+        Args:
+            path: Directory path to analyze
+            top_n: Number of top items to return
+        
+        Returns:
+            DiskAnalysis object
+        """
+        return self.analyze_full(path, top_n=top_n)
+    
     def build_directory_tree(self, directory: str, progress_callback=None, 
                            min_size: int = 0, max_depth: int = None) -> DiskItem:
         """
@@ -113,77 +140,153 @@ class DiskAnalyzer:
         Returns:
             DiskItem representing the root with all children
         """
-        def calculate_dir_size(path: str, current_depth: int = 0) -> Tuple[int, int, List[DiskItem]]:
+        def list_entries(path: str):
+            """List directory entries, or None if the directory can't be read"""
+            try:
+                with os.scandir(path) as it:
+                    return list(it)
+            except (OSError, PermissionError):
+                return None
+        
+        def open_frame(path: str, depth: int, entries: list) -> list:
+            """Create a traversal frame: [path, depth, entries, index, size, items, children, pending]"""
+            if progress_callback:
+                progress_callback(f"Scanning: {path}", 0, len(entries))
+            return [path, depth, entries, 0, 0, 0, [], []]
+        
+        def attach_dir(frame: list, entry: os.DirEntry, result: Tuple[int, int, List[DiskItem]]):
+            """Add a scanned subdirectory to its parent frame unless it was pruned"""
+            dir_size, dir_items, dir_children = result
+            # Pruned subtrees are dropped here without allocating a DiskItem;
+            # nothing below them survived, so their children list is empty too
+            if dir_size < min_size and not dir_children:
+                return
+            frame[6].append(DiskItem(
+                path=entry.path,
+                name=entry.name,
+                size=dir_size,
+                is_dir=True,
+                item_count=dir_items,
+                children=dir_children
+            ))
+            frame[4] += dir_size
+            frame[5] += dir_items
+        
+        def close_frame(frame: list) -> Tuple[int, int, List[DiskItem]]:
+            """Resolve pending subtrees, sort children and compute percentages"""
+            for entry, future in frame[7]:
+                attach_dir(frame, entry, future.result())
+            
+            total_size, item_count, children = frame[4], frame[5], frame[6]
+            if not children:
+                # Nothing survived the min_size filter: skip sorting and percentages
+                return total_size, item_count, children
+            
+            # Sort children by size (largest first)
+            children.sort(key=attrgetter('size'), reverse=True)
+            
+            # Calculate percentages (one division per folder, not per child)
+            if total_size > 0:
+                scale = 100.0 / total_size
+                for child in children:
+                    child.percentage = child.size * scale
+            
+            return total_size, item_count, children
+        
+        def calculate_dir_size(path: str, current_depth: int = 0,
+                               parallel: bool = False) -> Tuple[int, int, List[DiskItem]]:
             """Calculate directory size and build children list"""
             if max_depth is not None and current_depth >= max_depth:
                 return 0, 0, []
             
-            total_size = 0
-            item_count = 0
-            children = []
-            
-            try:
-                entries = os.listdir(path)
-            except (OSError, PermissionError):
+            entries = list_entries(path)
+            if entries is None:
                 return 0, 0, []
             
-            if progress_callback:
-                progress_callback(f"Scanning: {path}", 0, len(entries))
+            # Only parallelize when there are enough subtrees to pay for it;
+            # the pool is created only then
+            if parallel:
+                subdir_count = 0
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdir_count += 1
+                    except OSError:
+                        continue
+                if subdir_count > self.PARALLEL_MIN_SUBDIRS:
+                    with ThreadPoolExecutor() as executor:
+                        return walk(open_frame(path, current_depth, entries), executor)
             
-            for idx, entry in enumerate(entries):
-                entry_path = os.path.join(path, entry)
+            return walk(open_frame(path, current_depth, entries), None)
+        
+        def walk(root_frame: list, executor: Optional[ThreadPoolExecutor]) -> Tuple[int, int, List[DiskItem]]:
+            """Iterative post-order walk below root_frame, fanning its subdirectories out to executor"""
+            # Hot path: keep to str paths and os.scandir, do not convert to pathlib
+            stack = deque([root_frame])
+            
+            while stack:
+                frame = stack[-1]
+                entries = frame[2]
+                index = frame[3]
+                
+                if index == len(entries):
+                    # All entries visited: fold this directory into its parent
+                    stack.pop()
+                    dir_size, dir_items, dir_children = close_frame(frame)
+                    if not stack:
+                        return dir_size, dir_items, dir_children
+                    
+                    parent = stack[-1]
+                    attach_dir(parent, parent[2][parent[3] - 1], (dir_size, dir_items, dir_children))
+                    continue
+                
+                entry = entries[index]
+                frame[3] = index + 1
                 
                 if progress_callback:
-                    progress_callback(f"Scanning: {entry}", idx + 1, len(entries))
+                    progress_callback(f"Scanning: {entry.name}", index + 1, len(entries))
                 
                 try:
-                    if os.path.isfile(entry_path):
-                        size = os.path.getsize(entry_path)
+                    if entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
                         if size >= min_size:
-                            child = DiskItem(
-                                path=entry_path,
-                                name=entry,
+                            frame[6].append(DiskItem(
+                                path=entry.path,
+                                name=entry.name,
                                 size=size,
                                 is_dir=False,
                                 item_count=1
-                            )
-                            children.append(child)
-                            total_size += size
-                            item_count += 1
+                            ))
+                            frame[4] += size
+                            frame[5] += 1
                     
-                    elif os.path.isdir(entry_path):
-                        dir_size, dir_items, dir_children = calculate_dir_size(
-                            entry_path, current_depth + 1
-                        )
+                    elif entry.is_dir(follow_symlinks=False):
+                        child_depth = frame[1] + 1
+                        if frame is root_frame and executor is not None:
+                            frame[7].append((entry, executor.submit(
+                                calculate_dir_size, entry.path, child_depth
+                            )))
+                            continue
+                        
+                        if max_depth is not None and child_depth >= max_depth:
+                            child_entries = None
+                        else:
+                            child_entries = list_entries(entry.path)
                         
-                        if dir_size >= min_size or dir_children:
-                            child = DiskItem(
-                                path=entry_path,
-                                name=entry,
-                                size=dir_size,
-                                is_dir=True,
-                                item_count=dir_items,
-                                children=dir_children
-                            )
-                            children.append(child)
-                            total_size += dir_size
-                            item_count += dir_items
+                        if child_entries is None:
+                            # Unreadable or beyond max depth: counts as an empty folder
+                            attach_dir(frame, entry, (0, 0, []))
+                            continue
+                        
+                        stack.append(open_frame(entry.path, child_depth, child_entries))
                 
                 except (OSError, PermissionError):
                     continue
             
-            # Sort children by size (largest first)
-            children.sort(key=lambda x: x.size, reverse=True)
-            
-            # Calculate percentages
-            if total_size > 0:
-                for child in children:
-                    child.percentage = (child.size / total_size) * 100
-            
-            return total_size, item_count, children
+            return 0, 0, []
         
-        # Build the tree
-        root_size, root_items, root_children = calculate_dir_size(directory)
+        # Build the tree, scanning the root's subdirectories concurrently
+        root_size, root_items, root_children = calculate_dir_size(directory, parallel=True)
         
         root = DiskItem(
             path=directory,
@@ -207,18 +310,10 @@ class DiskAnalyzer:
         Returns:
             Dictionary mapping extension to total size
         """
-        files = self.scanner.scan_directory(path, recursive=True)
-        file_types = defaultdict(int)
-        
-        for file_info in files:
-            ext = os.path.splitext(file_info.path)[1].lower()
-            if ext:
-                file_types[ext] += file_info.size
-            else:
-                file_types['[no extension]'] += file_info.size
+        file_types = self.analyze_full(path, top_n=0).file_type_distribution
         
         # Sort by size
-        return dict(sorted(file_types.items(), key=lambda item: item[1], reverse=True))
+        return dict(sorted(file_types.items(), key=itemgetter(1), reverse=True))
     
     def find_large_files(self, path: str, min_size_mb: int = 100, top_n: int = 50) -> List[FileInfo]:
         """
@@ -232,13 +327,4 @@ class DiskAnalyzer:
         Returns:
             List of FileInfo objects
         """
-        min_size_bytes = min_size_mb * 1024 * 1024
-        files = self.scanner.scan_directory(path, recursive=True)
-        
-        # Filter by size
-        large_files = [f for f in files if f.size >= min_size_bytes]
-        
-        # Sort by size
-        large_files.sort(key=lambda f: f.size, reverse=True)
-        
-        return large_files[:top_n]
+        return self.analyze_full(path, top_n=top_n, min_size_mb=min_size_mb).largest_files
@@ -3,11 +3,13 @@ System cleaner - Remove temporary files, browser data, and junk.
 Windows-specific operations are guarded so the module can import elsewhere.
 """
 import os
-import shutil
+import stat
 import platform
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple
 from dataclasses import dataclass
-from pathlib import Path
 
 if platform.system() == "Windows":
     try:
@@ -20,6 +22,67 @@ else:
 IS_WINDOWS = platform.system() == "Windows"
 
 
+@lru_cache(maxsize=None)
+def _expand(path: str) -> str:
+    """Expand '~' in a cleaning target once; the home directory doesn't change"""
+    return os.path.expanduser(path)
+
+
+def is_link(st: os.stat_result) -> bool:
+    """Check an lstat() result for symlinks and Windows junctions, which must not be descended into"""
+    if stat.S_ISLNK(st.st_mode):
+        return True
+    attributes = getattr(st, 'st_file_attributes', 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def remove_tree(path: str) -> Tuple[int, bool]:
+    """
+    Delete a directory tree bottom-up, measuring sizes while unlinking
+    
+    Each file is stat'ed once from its directory entry and then unlinked,
+    so the tree is traversed a single time, with an explicit stack rather
+    than recursion, so depth is unbounded. Links and junctions are
+    unlinked, never followed. Entries that can't be removed are skipped
+    and the rest of the tree is still cleaned.
+    
+    Returns:
+        (size_freed, fully_removed)
+    """
+    # Hot path: keep to str paths with os.scandir/os.path, not pathlib
+    size_freed = 0
+    fully_removed = True
+    # (directory, contents_removed): directories are removed after their contents
+    stack = [(path, False)]
+    
+    while stack:
+        current, contents_removed = stack.pop()
+        if contents_removed:
+            try:
+                os.rmdir(current)
+            except OSError:
+                fully_removed = False
+            continue
+        
+        stack.append((current, True))
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if (entry.is_dir(follow_symlinks=False)
+                                and not is_link(entry.stat(follow_symlinks=False))):
+                            stack.append((entry.path, False))
+                        else:
+                            size = entry.stat(follow_symlinks=False).st_size
+                            os.unlink(entry.path)
+                            size_freed += size
+                    except OSError:
+                        fully_removed = False
+        except OSError:
+            fully_removed = False
+    
+    return size_freed, fully_removed
+
 
 @dataclass
 class CleaningResult:
@@ -40,37 +103,62 @@ class CleaningResult:
 class SystemCleaner:
     """Clean temporary files and system junk"""
     
+    # Worker threads used to delete independent paths concurrently
+    MAX_WORKERS = 8
+    
     def __init__(self):
         """Initialize system cleaner"""
         self.total_freed = 0
         self.total_files = 0
         self.results = []
+        self._results_lock = threading.Lock()
+    
+    def _add_result(self, result: CleaningResult):
+        """Record a cleaning result (categories may run concurrently)"""
+        with self._results_lock:
+            self.results.append(result)
+    
+    def _remove_paths(self, paths: List[str]) -> List[Tuple[str, bool, int]]:
+        """
+        Remove independent paths concurrently
+        
+        Returns:
+            List of (path, success, size_freed) in input order
+        """
+        if not paths:
+            return []
+        
+        workers = min(self.MAX_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(self._safe_remove, paths)
+            return [(path, success, size) for path, (success, size) in zip(paths, outcomes)]
     
     def _safe_remove(self, path: str) -> tuple[bool, int]:
         """
         Safely remove file or directory
         
         Returns:
-            (success, size_freed)
+            (success, size_freed): success only if the path is gone; a
+            partly deleted folder still reports the bytes it freed
         """
+        # Hot path: keep to str paths with os.* calls, not pathlib.
+        # A single lstat() replaces the isfile/isdir/getsize checks
         try:
-            if os.path.isfile(path):
-                size = os.path.getsize(path)
-                os.remove(path)
-                return True, size
-            elif os.path.isdir(path):
-                # Calculate size before removal
-                size = sum(
-                    os.path.getsize(os.path.join(root, f))
-                    for root, dirs, files in os.walk(path)
-                    for f in files
-                )
-                shutil.rmtree(path)
-                return True, size
+            st = os.lstat(path)
         except (OSError, PermissionError):
             return False, 0
         
-        return False, 0
+        if stat.S_ISDIR(st.st_mode) and not is_link(st):
+            # Measure while deleting
+            size, fully_removed = remove_tree(path)
+            return fully_removed, size
+        
+        # Files and links are unlinked directly (links are never followed)
+        try:
+            os.unlink(path)
+            return True, st.st_size
+        except (OSError, PermissionError):
+            return False, 0
     
     def clean_temp_files(self) -> CleaningResult:
         """Clean Windows temporary files"""
@@ -78,7 +166,7 @@ class SystemCleaner:
             os.environ.get('TEMP', ''),
             os.environ.get('TMP', ''),
             r'C:\Windows\Temp',
-            os.path.expanduser(r'~\AppData\Local\Temp'),
+            _expand(r'~\AppData\Local\Temp'),
         ]
         
         files_removed = 0
@@ -90,16 +178,17 @@ class SystemCleaner:
                 continue
             
             try:
-                for item in os.listdir(temp_dir):
-                    item_path = os.path.join(temp_dir, item)
-                    success, size = self._safe_remove(item_path)
-                    if success:
-                        files_removed += 1
-                        space_freed += size
-                    else:
-                        errors.append(f"Could not remove: {item_path}")
+                item_paths = [os.path.join(temp_dir, item) for item in os.listdir(temp_dir)]
             except (OSError, PermissionError) as e:
                 errors.append(f"Error accessing {temp_dir}: {str(e)}")
+                continue
+            
+            for item_path, success, size in self._remove_paths(item_paths):
+                space_freed += size
+                if success:
+                    files_removed += 1
+                else:
+                    errors.append(f"Could not remove: {item_path}")
         
         result = CleaningResult(
             category="Temporary Files",
@@ -108,7 +197,7 @@ class SystemCleaner:
             errors=errors,
             success=files_removed > 0
         )
-        self.results.append(result)
+        self._add_result(result)
         return result
     
     def clean_browser_cache(self, browsers: List[str] = None) -> CleaningResult:
@@ -123,15 +212,15 @@ class SystemCleaner:
         
         browser_paths = {
             'chrome': [
-                os.path.expanduser(r'~\AppData\Local\Google\Chrome\User Data\Default\Cache'),
-                os.path.expanduser(r'~\AppData\Local\Google\Chrome\User Data\Default\Code Cache'),
+                _expand(r'~\AppData\Local\Google\Chrome\User Data\Default\Cache'),
+                _expand(r'~\AppData\Local\Google\Chrome\User Data\Default\Code Cache'),
             ],
             'firefox': [
-                os.path.expanduser(r'~\AppData\Local\Mozilla\Firefox\Profiles'),
+                _expand(r'~\AppData\Local\Mozilla\Firefox\Profiles'),
             ],
             'edge': [
-                os.path.expanduser(r'~\AppData\Local\Microsoft\Edge\User Data\Default\Cache'),
-                os.path.expanduser(r'~\AppData\Local\Microsoft\Edge\User Data\Default\Code Cache'),
+                _expand(r'~\AppData\Local\Microsoft\Edge\User Data\Default\Cache'),
+                _expand(r'~\AppData\Local\Microsoft\Edge\User Data\Default\Code Cache'),
             ]
         }
         
@@ -139,6 +228,10 @@ class SystemCleaner:
         space_freed = 0
         errors = []
         
+        # Collect every cache directory first, then remove them concurrently
+        cache_paths = []
+        profile_caches = set()
+        
         for browser in browsers:
             if browser not in browser_paths:
                 continue
@@ -152,19 +245,19 @@ class SystemCleaner:
                         for profile in os.listdir(cache_path):
                             profile_cache = os.path.join(cache_path, profile, 'cache2')
                             if os.path.exists(profile_cache):
-                                success, size = self._safe_remove(profile_cache)
-                                if success:
-                                    files_removed += 1
-                                    space_freed += size
+                                cache_paths.append(profile_cache)
+                                profile_caches.add(profile_cache)
                     except (OSError, PermissionError) as e:
                         errors.append(f"Firefox error: {str(e)}")
                 else:
-                    success, size = self._safe_remove(cache_path)
-                    if success:
-                        files_removed += 1
-                        space_freed += size
-                    else:
-                        errors.append(f"Could not remove: {cache_path}")
+                    cache_paths.append(cache_path)
+        
+        for cache_path, success, size in self._remove_paths(cache_paths):
+            space_freed += size
+            if success:
+                files_removed += 1
+            elif cache_path not in profile_caches:
+                errors.append(f"Could not remove: {cache_path}")
         
         result = CleaningResult(
             category="Browser Cache",
@@ -173,7 +266,7 @@ class SystemCleaner:
             errors=errors,
             success=files_removed > 0
         )
-        self.results.append(result)
+        self._add_result(result)
         return result
     
     def empty_recycle_bin(self) -> CleaningResult:
@@ -186,7 +279,7 @@ class SystemCleaner:
                 errors=["Recycle Bin cleaning is available only on Windows."],
                 success=False,
             )
-            self.results.append(result)
+            self._add_result(result)
             return result
         try:
             # Get recycle bin size before emptying
@@ -223,15 +316,15 @@ class SystemCleaner:
                 success=False
             )
         
-        self.results.append(result)
+        self._add_result(result)
         return result
     
     def clean_recent_files(self) -> CleaningResult:
         """Clean recent files and jump lists"""
         recent_paths = [
-            os.path.expanduser(r'~\AppData\Roaming\Microsoft\Windows\Recent'),
-            os.path.expanduser(r'~\AppData\Roaming\Microsoft\Windows\Recent\AutomaticDestinations'),
-            os.path.expanduser(r'~\AppData\Roaming\Microsoft\Windows\Recent\CustomDestinations'),
+            _expand(r'~\AppData\Roaming\Microsoft\Windows\Recent'),
+            _expand(r'~\AppData\Roaming\Microsoft\Windows\Recent\AutomaticDestinations'),
+            _expand(r'~\AppData\Roaming\Microsoft\Windows\Recent\CustomDestinations'),
         ]
         
         files_removed = 0
@@ -243,14 +336,15 @@ class SystemCleaner:
                 continue
             
             try:
-                for item in os.listdir(recent_dir):
-                    item_path = os.path.join(recent_dir, item)
-                    success, size = self._safe_remove(item_path)
-                    if success:
-                        files_removed += 1
-                        space_freed += size
+                item_paths = [os.path.join(recent_dir, item) for item in os.listdir(recent_dir)]
             except (OSError, PermissionError) as e:
                 errors.append(f"Error: {str(e)}")
+                continue
+            
+            for _, success, size in self._remove_paths(item_paths):
+                space_freed += size
+                if success:
+                    files_removed += 1
         
         result = CleaningResult(
             category="Recent Files",
@@ -259,7 +353,7 @@ class SystemCleaner:
             errors=errors,
             success=files_removed > 0
         )
-        self.results.append(result)
+        self._add_result(result)
         return result
     
     def clean_windows_logs(self) -> CleaningResult:
@@ -278,15 +372,16 @@ class SystemCleaner:
                 continue
             
             try:
-                for item in os.listdir(log_dir):
-                    item_path = os.path.join(log_dir, item)
-                    if os.path.isfile(item_path):
-                        success, size = self._safe_remove(item_path)
-                        if success:
-                            files_removed += 1
-                            space_freed += size
+                item_paths = [os.path.join(log_dir, item) for item in os.listdir(log_dir)]
             except (OSError, PermissionError) as e:
                 errors.append(f"Error: {str(e)}")
+                continue
+            
+            item_paths = [item_path for item_path in item_paths if os.path.isfile(item_path)]
+            for _, success, size in self._remove_paths(item_paths):
+                space_freed += size
+                if success:
+                    files_removed += 1
         
         result = CleaningResult(
             category="Windows Logs",
@@ -295,7 +390,7 @@ class SystemCleaner:
             errors=errors,
             success=files_removed > 0
         )
-        self.results.append(result)
+        self._add_result(result)
         return result
     
     def clean_all(self, options: Dict[str, bool] = None) -> List[CleaningResult]:
@@ -319,21 +414,35 @@ class SystemCleaner:
         
         self.results = []
         
+        # File-based categories touch disjoint directories, so run them concurrently
+        operations = []
         if options.get('temp_files', True):
-            self.clean_temp_files()
+            operations.append(self.clean_temp_files)
         
         if options.get('browser_cache', True):
-            self.clean_browser_cache()
+            operations.append(self.clean_browser_cache)
         
-        if options.get('recycle_bin', False):
-            self.empty_recycle_bin()
+        # The recycle bin is reported between browser cache and recent files
+        recycle_index = len(operations)
         
         if options.get('recent_files', True):
-            self.clean_recent_files()
+            operations.append(self.clean_recent_files)
         
         if options.get('log_files', True):
-            self.clean_windows_logs()
+            operations.append(self.clean_windows_logs)
+        
+        results = []
+        if operations:
+            with ThreadPoolExecutor(max_workers=len(operations)) as pool:
+                futures = [pool.submit(operation) for operation in operations]
+                results = [future.result() for future in futures]
+        
+        # The recycle bin goes through COM (winshell), so keep it on the calling thread
+        if options.get('recycle_bin', False):
+            results.insert(recycle_index, self.empty_recycle_bin())
         
+        # Report categories in their usual order regardless of completion order
+        self.results = results
         return self.results
     
     def get_total_statistics(self) -> Dict[str, any]:
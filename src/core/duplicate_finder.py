@@ -3,18 +3,158 @@ Duplicate file finder using hash-based content comparison
 Efficiently detects files with identical content
 """
 import os
+import mmap
+import queue
+import sqlite3
 import hashlib
-from typing import Dict, List, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import partial
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from utils.scanner import FileInfo, Scanner
+from utils.logger import get_logger
 
+try:
+    import blake3  # type: ignore
+except ImportError:
+    blake3 = None
+
+
+# hashlib.sha256 comes from _hashlib when CPython is linked against OpenSSL,
+# which dispatches to SHA-NI/AVX2 at runtime; the _sha256 fallback is portable C
+OPENSSL_SHA256 = getattr(hashlib.sha256, '__module__', None) == '_hashlib'
+
+# Duplicate detection needs content identity, not a cryptographic hash.
+# BLAKE3 (optional package, SIMD across AVX-512/AVX2/NEON) is the fastest;
+# otherwise SHA256 via OpenSSL, and without OpenSSL BLAKE2b (always built
+# in, 64-bit optimized C) beats the portable SHA256.
+if blake3 is not None:
+    HASH_ALGORITHM = 'blake3'
+elif OPENSSL_SHA256:
+    HASH_ALGORITHM = 'sha256'
+else:
+    HASH_ALGORITHM = 'blake2b'
+
+# Fresh hash objects are cloned from an untouched prototype: copy() is a
+# memcpy of the state, cheaper than a full constructor lookup and init.
+# The prototype is never updated, so sharing it across threads is safe.
+if blake3 is not None:
+    _hash_prototype = blake3.blake3()
+else:
+    _hash_prototype = getattr(hashlib, HASH_ALGORITHM)()
+_new_hash = _hash_prototype.copy
+
+# Buffer size fed to hash.update(); >= 256 KiB keeps the compression loop in C
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed straight from a read-only mapping
+MMAP_MIN_SIZE = 1 << 20
+
+# Persistent cache of full-content hashes between runs
+HASH_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.pcassist_hashcache.db')
+
+# O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN in the Windows CRT
+_SEQUENTIAL_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+
+
+def _open_sequential(filepath: str) -> int:
+    """Open filepath for a front-to-back read, hinting the OS to read ahead"""
+    fd = os.open(filepath, _SEQUENTIAL_READ_FLAGS)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return fd
+
+
+def _hash_mapped(fd: int) -> str:
+    """Content hash of a file via mmap, avoiding the page cache to bytes copy"""
+    try:
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # e.g. address space exhausted on 32-bit builds; caller streams instead
+        return None
+    
+    try:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        digest = _new_hash()
+        digest.update(mapped)
+        return digest.hexdigest()
+    finally:
+        mapped.close()
+
+
+class HashCache:
+    """
+    SQLite-backed cache of file content hashes
+    
+    Entries are keyed on (st_dev, st_ino) and only reused while size and
+    mtime_ns still match, so any modification invalidates them.
+    """
+    
+    COMMIT_EVERY = 500
+    
+    def __init__(self, db_path: str):
+        """Open (or create) the cache database at db_path"""
+        self._lock = threading.Lock()
+        self._pending = 0
+        # Hash workers share the connection; every access holds _lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS h('
+            'dev INTEGER, ino INTEGER, size INTEGER, mtime INTEGER, algo TEXT, sha TEXT, '
+            'PRIMARY KEY(dev, ino))'
+        )
+        self._conn.commit()
+    
+    def get(self, st: os.stat_result, algo: str = HASH_ALGORITHM) -> Optional[str]:
+        """Return the cached hash for a stat result, or None if missing/stale"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT sha FROM h WHERE dev=? AND ino=? AND size=? AND mtime=? AND algo=?',
+                    (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, algo)
+                ).fetchone()
+        except (sqlite3.Error, OverflowError):
+            return None
+        return row[0] if row else None
+    
+    def put(self, st: os.stat_result, digest: str, algo: str = HASH_ALGORITHM):
+        """Store a hash, committing every COMMIT_EVERY inserts"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO h VALUES (?, ?, ?, ?, ?, ?)',
+                    (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, algo, digest)
+                )
+                self._pending += 1
+                if self._pending >= self.COMMIT_EVERY:
+                    self._conn.commit()
+                    self._pending = 0
+        except (sqlite3.Error, OverflowError):
+            pass
+    
+    def flush(self):
+        """Commit pending inserts"""
+        try:
+            with self._lock:
+                if self._pending:
+                    self._conn.commit()
+                    self._pending = 0
+        except sqlite3.Error:
+            pass
 
 
 @dataclass
 class DuplicateGroup:
     """Group of duplicate files"""
-    hash: str
+    hash: str  # Content digest, computed with HASH_ALGORITHM
     files: List[FileInfo]
     total_size: int
     
@@ -28,47 +168,271 @@ class DuplicateGroup:
 class DuplicateFinder:
     """Find duplicate files based on content hash"""
     
-    def __init__(self, excluded_paths: List[str] = None, min_size: int = 0):
+    # Prefix hashing reads only PREFIX_SIZE bytes per file, so the pool keeps
+    # at least IO_QUEUE_DEPTH of those small reads in flight, even on
+    # machines with few cores, to overlap their latency
+    IO_QUEUE_DEPTH = 32
+    MAX_WORKERS = min(64, max(IO_QUEUE_DEPTH, (os.cpu_count() or 1) * 2))
+    
+    # Full-file hashing and pair comparison read whole files sequentially;
+    # too many at once thrash a spinning disk, so they get a CPU-sized pool
+    FULL_HASH_WORKERS = min(8, os.cpu_count() or 1)
+    
+    # Small same-size files are hashed BATCH_LANES at a time per pool task,
+    # so per-future overhead does not dwarf the digest work itself
+    BATCH_LANES = 8
+    SMALL_FILE_SIZE = 64 * 1024
+    
+    # Bytes hashed per file before committing to a full-content hash
+    PREFIX_SIZE = 4096
+    
+    # Read size per file when comparing a same-size pair directly
+    COMPARE_CHUNK_SIZE = 256 * 1024
+    
+    # Confirmed groups handed to group_callback at a time
+    GROUP_BATCH_SIZE = 64
+    
+    # Threads walking top-level subdirectories concurrently; directory
+    # enumeration is syscall wait, so overlapping walks hides the latency
+    WALK_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+    # FileInfos a walker hands over at a time
+    WALK_CHUNK = 256
+    
+    def __init__(
+        self,
+        excluded_paths: List[str] = None,
+        min_size: int = 0,
+        hash_cache_path: Optional[str] = HASH_CACHE_PATH
+    ):
         """
         Initialize duplicate finder
         
         Args:
             excluded_paths: Paths to exclude from scanning
             min_size: Minimum file size to consider (bytes)
+            hash_cache_path: SQLite file caching hashes between runs (None disables)
         """
         self.scanner = Scanner(excluded_paths)
         self.min_size = min_size
         self.duplicates = {}
         self.scanned_files = 0
         self.total_wasted_space = 0
+        self._cancelled = threading.Event()
+        
+        if HASH_ALGORITHM == 'blake2b':
+            get_logger().warning("hashlib is not OpenSSL-backed; hashing with BLAKE2b instead of SHA256")
+        
+        self.hash_cache = None
+        if hash_cache_path:
+            try:
+                self.hash_cache = HashCache(hash_cache_path)
+            except sqlite3.Error as e:
+                get_logger().warning(f"Hash cache unavailable ({hash_cache_path}): {e}")
     
-    def calculate_hash(self, filepath: str, chunk_size: int = 8192) -> str:
+    def cancel(self):
         """
-        Calculate SHA256 hash of file content
+        Stop find_duplicates as soon as possible; safe to call from any thread
+        
+        The running call returns the groups confirmed so far. Cancellation is
+        final: later calls on this finder return at once too.
+        """
+        self._cancelled.set()
+    
+    def calculate_hash(self, filepath: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+        """
+        Calculate content hash of file with HASH_ALGORITHM
         
         Args:
             filepath: Path to file
-            chunk_size: Size of chunks to read
+            chunk_size: Size of chunks to read (fallback loop only)
         
         Returns:
             Hexadecimal hash string
         """
-        sha256 = hashlib.sha256()
         try:
-            with open(filepath, 'rb') as f:
+            cache = self.hash_cache
+            if cache is not None:
+                st = os.stat(filepath)
+                digest = cache.get(st)
+                if digest:
+                    return digest
+            
+            with open(_open_sequential(filepath), 'rb', buffering=0) as f:
+                digest = self._hash_open_file(f, chunk_size)
+            
+            if cache is not None and digest:
+                cache.put(st, digest)
+            return digest
+        except (OSError, PermissionError):
+            return None
+    
+    @staticmethod
+    def _hash_open_file(f, chunk_size: int) -> str:
+        """Content hash of an open, unbuffered binary file"""
+        if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            digest = _hash_mapped(f.fileno())
+            if digest:
+                return digest
+        
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: reuses one buffer via readinto; update() releases the GIL on large chunks
+            return hashlib.file_digest(f, _new_hash).hexdigest()
+        
+        digest = _new_hash()
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+        return digest.hexdigest()
+    
+    def calculate_prefix_hash(self, filepath: str, prefix_size: int = PREFIX_SIZE) -> str:
+        """
+        Calculate content hash of the first prefix_size bytes of a file
+        
+        Args:
+            filepath: Path to file
+            prefix_size: Number of leading bytes to hash
+        
+        Returns:
+            Hexadecimal hash string
+        """
+        try:
+            # One raw read at offset 0: no buffered file object, no seek
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                digest = _new_hash()
+                digest.update(os.read(fd, prefix_size))
+                return digest.hexdigest()
+            finally:
+                os.close(fd)
+        except (OSError, PermissionError):
+            return None
+    
+    def files_equal(self, path_a: str, path_b: str, offset: int = 0) -> bool:
+        """
+        Compare two files byte by byte, stopping at the first difference
+        
+        Args:
+            path_a: First file
+            path_b: Second file
+            offset: Leading bytes already known to match
+        
+        Returns:
+            True if contents from offset onward are identical
+        """
+        chunk_size = self.COMPARE_CHUNK_SIZE
+        try:
+            with open(_open_sequential(path_a), 'rb', buffering=chunk_size) as fa, \
+                    open(_open_sequential(path_b), 'rb', buffering=chunk_size) as fb:
+                fa.seek(offset)
+                fb.seek(offset)
                 while True:
-                    chunk = f.read(chunk_size)
+                    if self._cancelled.is_set():
+                        return False
+                    chunk = fa.read(chunk_size)
+                    if chunk != fb.read(chunk_size):
+                        return False
                     if not chunk:
-                        break
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                        return True
         except (OSError, PermissionError):
-            return None
+            return False
+    
+    def _hash_batch(self, hash_func, paths: List[str]) -> List[str]:
+        """Hash several files in one pool task (none once cancelled)"""
+        if self._cancelled.is_set():
+            return [None] * len(paths)
+        return [hash_func(path) for path in paths]
+    
+    def _hash_buckets(self, executor, buckets, hash_func):
+        """
+        Hash bucketed files on the pool
+        
+        Args:
+            executor: Pool to run hash_func on
+            buckets: Iterable of same-size FileInfo lists
+            hash_func: Function mapping a path to its hash
+        
+        Returns:
+            Iterator of (FileInfo, hash) in bucket order
+        """
+        ordered = []
+        batches = []
+        
+        for files in buckets:
+            ordered.extend(files)
+            paths = [file_info.path for file_info in files]
+            step = self.BATCH_LANES if files[0].size < self.SMALL_FILE_SIZE else 1
+            for i in range(0, len(paths), step):
+                batches.append(paths[i:i + step])
+        
+        hashes = executor.map(partial(self._hash_batch, hash_func), batches)
+        return zip(ordered, chain.from_iterable(hashes))
+    
+    def _walk_subtree(self, subtree: str, results: queue.Queue):
+        """Walk one subtree on a walker thread, queueing FileInfos in chunks"""
+        # Scanner keeps per-walk counters, so each walker gets its own
+        scanner = Scanner(self.scanner.excluded_paths)
+        cancelled = self._cancelled.is_set
+        chunk = []
+        for file_info in scanner.iter_files(subtree, recursive=True):
+            if cancelled():
+                return
+            chunk.append(file_info)
+            if len(chunk) >= self.WALK_CHUNK:
+                results.put(chunk)
+                chunk = []
+        if chunk:
+            results.put(chunk)
+    
+    def _iter_files(self, directories: List[str]):
+        """
+        Yield every file under directories
+        
+        Top-level files are listed directly; the top-level subdirectories
+        are walked concurrently on WALK_WORKERS threads, in no fixed order.
+        """
+        subtrees = []
+        for directory in directories:
+            if not os.path.exists(directory):
+                continue
+            
+            yield from self.scanner.iter_files(directory, recursive=False)
+            try:
+                with os.scandir(directory) as entries:
+                    subtrees.extend(
+                        entry.path for entry in entries
+                        if entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+        
+        if len(subtrees) < 2 or self.WALK_WORKERS < 2:
+            for subtree in subtrees:
+                yield from self.scanner.iter_files(subtree, recursive=True)
+            return
+        
+        # Unbounded, so walkers never block if the consumer stops early
+        results = queue.Queue()
+        with ThreadPoolExecutor(max_workers=self.WALK_WORKERS) as walkers:
+            for subtree in subtrees:
+                future = walkers.submit(self._walk_subtree, subtree, results)
+                # None marks one finished walk, successful or not
+                future.add_done_callback(lambda _: results.put(None))
+            
+            remaining = len(subtrees)
+            while remaining:
+                chunk = results.get()
+                if chunk is None:
+                    remaining -= 1
+                else:
+                    yield from chunk
     
     def find_duplicates(
         self,
         directories: List[str],
-        callback=None
+        callback=None,
+        group_callback=None
     ) -> Dict[str, DuplicateGroup]:
         """
         Find duplicate files in given directories
@@ -76,58 +440,150 @@ class DuplicateFinder:
         Args:
             directories: List of directories to scan
             callback: Progress callback(current_file, count)
+            group_callback: Called with lists of newly confirmed DuplicateGroups
+                (up to GROUP_BATCH_SIZE at a time) while the scan is still running
         
         Returns:
             Dictionary mapping hash to DuplicateGroup
         """
-        # First pass: Group files by size (quick filter)
-        size_groups = defaultdict(list)
+        size_map: Dict[int, Union[FileInfo, List[FileInfo]]] = {}
+        min_size = self.min_size
+        cancelled = self._cancelled.is_set
         
-        for directory in directories:
-            if not os.path.exists(directory):
-                continue
-            
-            files = self.scanner.scan_directory(directory, recursive=True)
-            
-            for file_info in files:
-                if file_info.size >= self.min_size:
-                    size_groups[file_info.size].append(file_info)
-        
-        # Second pass: Calculate hashes only for files with same size
-        hash_groups = defaultdict(list)
         self.scanned_files = 0
-        
-        for size, files in size_groups.items():
-            if len(files) < 2:
-                # Skip files with unique size
-                continue
-            
-            for file_info in files:
-                file_hash = self.calculate_hash(file_info.path)
-                if file_hash:
-                    hash_groups[file_hash].append(file_info)
-                    self.scanned_files += 1
-                    
-                    if callback:
-                        callback(file_info.path, self.scanned_files)
-        
-        # Third pass: Keep only actual duplicates (hash appears multiple times)
         self.duplicates = {}
         self.total_wasted_space = 0
+        batch = []
+        
+        def confirm(file_hash, files):
+            # Sort by modification date (keep oldest first)
+            files.sort(key=attrgetter('mtime_ns'))
+            
+            # Every file in a group has the same size
+            group = DuplicateGroup(
+                hash=file_hash,
+                files=files,
+                total_size=files[0].size * len(files)
+            )
+            self.duplicates[file_hash] = group
+            self.total_wasted_space += group.get_wasted_space()
+            
+            if group_callback:
+                batch.append(group)
+                if len(batch) >= self.GROUP_BATCH_SIZE:
+                    group_callback(batch[:])
+                    batch.clear()
         
-        for file_hash, files in hash_groups.items():
-            if len(files) > 1:
-                # Sort by modification date (keep oldest first)
-                files.sort(key=lambda f: f.modified)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            prefix_batch = partial(self._hash_batch, self.calculate_prefix_hash)
+            prefix_jobs = []  # (files, future) in submission order
+            pending = []
+            
+            def submit_pending():
+                paths = [file_info.path for file_info in pending]
+                prefix_jobs.append((pending[:], executor.submit(prefix_batch, paths)))
+                pending.clear()
+            
+            def queue_prefix(file_info):
+                pending.append(file_info)
+                if len(pending) >= self.BATCH_LANES:
+                    submit_pending()
+            
+            # First pass: Group files by size (quick filter) while scanning.
+            # A size seen once maps straight to its FileInfo; on the first
+            # collision both files are queued for prefix hashing, and later
+            # arrivals of that size are queued at once, so the pool hashes
+            # while the scanner is still walking.
+            for file_info in self._iter_files(directories):
+                if cancelled():
+                    break
+                size = file_info.size
+                if size < min_size:
+                    continue
                 
-                total_size = sum(f.size for f in files)
-                group = DuplicateGroup(
-                    hash=file_hash,
-                    files=files,
-                    total_size=total_size
-                )
-                self.duplicates[file_hash] = group
-                self.total_wasted_space += group.get_wasted_space()
+                existing = size_map.get(size)
+                if existing is None:
+                    size_map[size] = file_info
+                    continue
+                
+                if type(existing) is list:
+                    existing.append(file_info)
+                else:
+                    size_map[size] = [existing, file_info]
+                    queue_prefix(existing)
+                queue_prefix(file_info)
+            
+            if pending:
+                submit_pending()
+            
+            # Every collision is queued; release the singleton FileInfos
+            del size_map
+            
+            # Second pass: Split same-size files by their prefix hash.
+            # Results are read in submission order; callback stays on this thread
+            prefix_groups = defaultdict(list)
+            
+            for files, future in prefix_jobs:
+                if cancelled():
+                    # Jobs still queued return no hashes; nothing is confirmed
+                    prefix_groups.clear()
+                    break
+                for file_info, prefix_hash in zip(files, future.result()):
+                    if prefix_hash:
+                        prefix_groups[(file_info.size, prefix_hash)].append(file_info)
+                        self.scanned_files += 1
+                        
+                        if callback:
+                            callback(file_info.path, self.scanned_files)
+            
+            # Whole-file reads run on a smaller pool: many concurrent
+            # sequential readers make a spinning disk seek between them
+            with ThreadPoolExecutor(max_workers=self.FULL_HASH_WORKERS) as full_pool:
+                # Full hash only where both size and prefix still collide. A pair
+                # is compared directly instead: that stops at the first differing
+                # block, and costs no more I/O than hashing both when equal.
+                full_buckets = []
+                pair_checks = []
+                for (size, prefix_hash), files in prefix_groups.items():
+                    if len(files) < 2:
+                        continue
+                    if size <= self.PREFIX_SIZE:
+                        # Prefix covered the whole file, so it is the content hash
+                        confirm(prefix_hash, files)
+                    elif len(files) == 2:
+                        future = full_pool.submit(
+                            self.files_equal, files[0].path, files[1].path, self.PREFIX_SIZE
+                        )
+                        pair_checks.append((f"pair:{size}:{prefix_hash}", files, future))
+                    else:
+                        full_buckets.append(files)
+                
+                # Equal full hashes imply equal size and prefix, i.e. the same
+                # bucket, so a bucket's groups are final once its last file is in
+                bucket_ends = iter(len(files) for files in full_buckets)
+                remaining = 0
+                hash_groups = defaultdict(list)
+                for file_info, file_hash in self._hash_buckets(full_pool, full_buckets, self.calculate_hash):
+                    if not remaining:
+                        remaining = next(bucket_ends)
+                    if file_hash:
+                        hash_groups[file_hash].append(file_info)
+                    remaining -= 1
+                    if not remaining:
+                        for file_hash, files in hash_groups.items():
+                            if len(files) > 1:
+                                confirm(file_hash, files)
+                        hash_groups.clear()
+                
+                for pair_key, files, future in pair_checks:
+                    if future.result():
+                        confirm(pair_key, files)
+        
+        if self.hash_cache is not None:
+            self.hash_cache.flush()
+        
+        if batch:
+            group_callback(batch[:])
         
         return self.duplicates
     
@@ -3,9 +3,11 @@ System optimizer - Manage startup programs and monitor resources.
 Startup management is Windows-only; resource monitoring works everywhere.
 """
 import os
+import time
+import ctypes
 import platform
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import psutil
 
@@ -16,6 +18,46 @@ except ImportError:
 
 IS_WINDOWS = platform.system() == "Windows" and winreg is not None
 
+# NtQuerySystemInformation: SystemProcessInformation returns the whole
+# process table (names, CPU times, working sets) in a single call
+SYSTEM_PROCESS_INFORMATION_CLASS = 5
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+
+
+class _UnicodeString(ctypes.Structure):
+    _fields_ = [
+        ('Length', ctypes.c_uint16),
+        ('MaximumLength', ctypes.c_uint16),
+        ('Buffer', ctypes.c_void_p),
+    ]
+
+
+class _SystemProcessInformation(ctypes.Structure):
+    """Leading fields of SYSTEM_PROCESS_INFORMATION (winternl.h)"""
+    _fields_ = [
+        ('NextEntryOffset', ctypes.c_uint32),
+        ('NumberOfThreads', ctypes.c_uint32),
+        ('WorkingSetPrivateSize', ctypes.c_int64),
+        ('HardFaultCount', ctypes.c_uint32),
+        ('NumberOfThreadsHighWatermark', ctypes.c_uint32),
+        ('CycleTime', ctypes.c_uint64),
+        ('CreateTime', ctypes.c_int64),
+        ('UserTime', ctypes.c_int64),
+        ('KernelTime', ctypes.c_int64),
+        ('ImageName', _UnicodeString),
+        ('BasePriority', ctypes.c_int32),
+        ('UniqueProcessId', ctypes.c_void_p),
+        ('InheritedFromUniqueProcessId', ctypes.c_void_p),
+        ('HandleCount', ctypes.c_uint32),
+        ('SessionId', ctypes.c_uint32),
+        ('UniqueProcessKey', ctypes.c_void_p),
+        ('PeakVirtualSize', ctypes.c_size_t),
+        ('VirtualSize', ctypes.c_size_t),
+        ('PageFaultCount', ctypes.c_uint32),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+    ]
+
 
 @dataclass
 class StartupItem:
@@ -25,6 +67,7 @@ class StartupItem:
     location: str  # 'registry' or 'folder'
     registry_path: Optional[str]
     enabled: bool
+    hkey: Optional[int] = None  # Hive the value was read from (registry items)
 
 
 @dataclass
@@ -55,6 +98,13 @@ class SystemOptimizer:
     def __init__(self):
         """Initialize system optimizer"""
         self.startup_items: List[StartupItem] = []
+        
+        # Previous system-wide CPU sample (busy, total) for non-blocking usage
+        self._last_cpu = self._cpu_busy_total(psutil.cpu_times())
+        
+        # Previous process table sample: {pid: (create_time, cpu_time)}
+        self._process_cpu_times = {}
+        self._process_sample_time = None
     
     def get_startup_programs(self) -> List[StartupItem]:
         """
@@ -74,22 +124,21 @@ class SystemOptimizer:
         for hkey, path in self.STARTUP_REGISTRY_PATHS:
             try:
                 with winreg.OpenKey(hkey, path) as key:
-                    index = 0
-                    while True:
+                    value_count = winreg.QueryInfoKey(key)[1]
+                    for index in range(value_count):
                         try:
                             value_name, value_data, value_type = winreg.EnumValue(key, index)
-                            
-                            self.startup_items.append(StartupItem(
-                                name=value_name,
-                                command=value_data,
-                                location='registry',
-                                registry_path=path,
-                                enabled=True
-                            ))
-                            
-                            index += 1
                         except OSError:
                             break
+                        
+                        self.startup_items.append(StartupItem(
+                            name=value_name,
+                            command=value_data,
+                            location='registry',
+                            registry_path=path,
+                            enabled=True,
+                            hkey=hkey
+                        ))
             except (OSError, PermissionError):
                 continue
         
@@ -134,18 +183,63 @@ class SystemOptimizer:
             return self._remove_folder_startup(item)
         return False
     
-    def _remove_registry_startup(self, item: StartupItem) -> bool:
-        """Remove startup item from registry"""
-        try:
-            # Determine hive
-            if "HKEY_CURRENT_USER" in item.registry_path or item.registry_path.startswith("SOFTWARE"):
+    def disable_startup_programs(self, items: List[StartupItem]) -> List[bool]:
+        """
+        Disable several startup programs
+        
+        Registry entries are grouped by key, and each key is opened once
+        for all of its values.
+        
+        Args:
+            items: StartupItems to disable
+        
+        Returns:
+            Success flag for each item, in the same order
+        """
+        results = [False] * len(items)
+        if not IS_WINDOWS:
+            return results
+        
+        by_key = {}
+        for index, item in enumerate(items):
+            if item.location == 'registry':
+                by_key.setdefault(self._startup_key(item), []).append(index)
+            elif item.location == 'folder':
+                results[index] = self._remove_folder_startup(item)
+        
+        for (hkey, path), indexes in by_key.items():
+            try:
+                with winreg.OpenKey(hkey, path, 0, winreg.KEY_SET_VALUE) as key:
+                    for index in indexes:
+                        try:
+                            winreg.DeleteValue(key, items[index].name)
+                            results[index] = True
+                        except (OSError, PermissionError):
+                            pass
+            except (OSError, PermissionError):
+                continue
+        
+        return results
+    
+    @staticmethod
+    def _startup_key(item: StartupItem) -> Tuple[int, str]:
+        """Return the (hive, subkey path) holding a registry startup item"""
+        # Determine hive: recorded at enumeration, else parsed from the path
+        hkey = item.hkey
+        if hkey is None:
+            if item.registry_path.startswith(("HKEY_CURRENT_USER\\", "HKCU\\")):
                 hkey = winreg.HKEY_CURRENT_USER
             else:
                 hkey = winreg.HKEY_LOCAL_MACHINE
-            
-            # Clean path
-            path = item.registry_path.replace("HKEY_LOCAL_MACHINE\\", "").replace("HKEY_CURRENT_USER\\", "")
-            
+        
+        # Clean path
+        path = item.registry_path.replace("HKEY_LOCAL_MACHINE\\", "").replace("HKEY_CURRENT_USER\\", "")
+        return hkey, path
+    
+    def _remove_registry_startup(self, item: StartupItem) -> bool:
+        """Remove startup item from registry"""
+        try:
+            hkey, path = self._startup_key(item)
             with winreg.OpenKey(hkey, path, 0, winreg.KEY_SET_VALUE) as key:
                 winreg.DeleteValue(key, item.name)
             
@@ -163,15 +257,35 @@ class SystemOptimizer:
             pass
         return False
     
+    @staticmethod
+    def _cpu_busy_total(times) -> Tuple[float, float]:
+        """Split a psutil.cpu_times() sample into (busy, total) seconds"""
+        total = sum(times)
+        # Linux already counts guest time inside user/nice
+        total -= getattr(times, 'guest', 0) + getattr(times, 'guest_nice', 0)
+        idle = times.idle + getattr(times, 'iowait', 0)
+        return total - idle, total
+    
     def get_system_resources(self) -> ResourceStats:
         """
         Get current system resource usage
         
+        CPU usage covers the time since the previous call (or since the
+        optimizer was created), so the call never blocks.
+        
         Returns:
             ResourceStats object
         """
         # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        busy, total = self._cpu_busy_total(psutil.cpu_times())
+        last_busy, last_total = self._last_cpu
+        self._last_cpu = (busy, total)
+        
+        dt_total = total - last_total
+        if dt_total > 0:
+            cpu_percent = round(min(100.0, max(0.0, (busy - last_busy) / dt_total * 100)), 1)
+        else:
+            cpu_percent = 0.0
         
         # Memory usage
         memory = psutil.virtual_memory()
@@ -200,20 +314,100 @@ class SystemOptimizer:
         Returns:
             List of process dictionaries
         """
-        processes = []
-        
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        processes = None
+        if IS_WINDOWS:
             try:
-                processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cpu_percent': proc.info['cpu_percent'],
-                    'memory_percent': proc.info['memory_percent']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+                processes = self._get_process_list_windows()
+            except (OSError, AttributeError, ValueError):
+                processes = None
+        
+        if processes is None:
+            processes = []
+            
+            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+                try:
+                    processes.append({
+                        'pid': proc.info['pid'],
+                        'name': proc.info['name'],
+                        'cpu_percent': proc.info['cpu_percent'],
+                        'memory_percent': proc.info['memory_percent']
+                    })
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
         
         # Sort by CPU usage
         processes.sort(key=lambda p: p['cpu_percent'] or 0, reverse=True)
         
         return processes
+    
+    def _query_process_table(self) -> ctypes.Array:
+        """Fetch the raw SystemProcessInformation buffer, growing it as needed"""
+        ntdll = ctypes.windll.ntdll
+        size = 256 * 1024
+        
+        while True:
+            buffer = ctypes.create_string_buffer(size)
+            needed = ctypes.c_uint32(0)
+            status = ntdll.NtQuerySystemInformation(
+                SYSTEM_PROCESS_INFORMATION_CLASS, buffer, size, ctypes.byref(needed)
+            ) & 0xFFFFFFFF
+            
+            if status == 0:
+                return buffer
+            if status != STATUS_INFO_LENGTH_MISMATCH:
+                raise OSError(f"NtQuerySystemInformation failed: 0x{status:08X}")
+            
+            # Table can grow between calls; leave headroom
+            size = max(size * 2, needed.value + 64 * 1024)
+    
+    def _get_process_list_windows(self) -> List[dict]:
+        """
+        Build the process list from one NtQuerySystemInformation call
+        
+        CPU usage is the change in user+kernel time since the previous call,
+        divided by elapsed wall time (0.0 on first sight, like psutil).
+        """
+        buffer = self._query_process_table()
+        now = time.monotonic()
+        total_memory = psutil.virtual_memory().total
+        
+        elapsed = None
+        if self._process_sample_time is not None:
+            elapsed = now - self._process_sample_time
+        previous = self._process_cpu_times
+        current = {}
+        processes = []
+        
+        offset = 0
+        while True:
+            entry = _SystemProcessInformation.from_buffer(buffer, offset)
+            pid = entry.UniqueProcessId or 0
+            
+            if entry.ImageName.Buffer:
+                name = ctypes.wstring_at(entry.ImageName.Buffer, entry.ImageName.Length // 2)
+            else:
+                name = 'System Idle Process' if pid == 0 else ''
+            
+            # CPU times are in 100ns units
+            cpu_time = (entry.UserTime + entry.KernelTime) / 1e7
+            current[pid] = (entry.CreateTime, cpu_time)
+            
+            cpu_percent = 0.0
+            last = previous.get(pid)
+            if elapsed and last and last[0] == entry.CreateTime:
+                cpu_percent = round(max(0.0, cpu_time - last[1]) / elapsed * 100, 1)
+            
+            processes.append({
+                'pid': pid,
+                'name': name,
+                'cpu_percent': cpu_percent,
+                'memory_percent': entry.WorkingSetSize / total_memory * 100
+            })
+            
+            if not entry.NextEntryOffset:
+                break
+            offset += entry.NextEntryOffset
+        
+        self._process_cpu_times = current
+        self._process_sample_time = now
+        return processes
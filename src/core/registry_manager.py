@@ -2,18 +2,25 @@
 Windows Registry manager.
 The module keeps the Windows-specific logic but can be imported on other platforms.
 """
+import gzip
 import os
 import platform
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from functools import partial
+from typing import Dict, List, Optional
 
 try:
     import winreg  # type: ignore
 except ImportError:
     winreg = None
 
+from core._winreg_fast import enum_subkeys, enum_values
+
 IS_WINDOWS = platform.system() == "Windows" and winreg is not None
 
 
@@ -24,6 +31,7 @@ class RegistryIssue:
     value_name: str
     issue_type: str  # 'invalid_path', 'orphaned_uninstall', 'missing_file'
     description: str
+    hkey: Optional[int] = None  # Hive the key was read from
 
 
 class RegistryManager:
@@ -40,9 +48,22 @@ class RegistryManager:
         else []
     )
 
+    # Open keys in the 64-bit view explicitly so a 32-bit interpreter is not
+    # silently redirected to WOW6432Node, which is scanned on its own
+    _OPEN_FLAGS = winreg.KEY_READ | winreg.KEY_WOW64_64KEY if IS_WINDOWS else 0
+
+    # winreg releases the GIL around registry calls, so subkeys are probed
+    # concurrently to overlap their kernel-side latency
+    MAX_WORKERS = 16
+
+    # Copy buffer for compressing and expanding registry backups
+    BACKUP_COPY_CHUNK = 1024 * 1024
+
     def __init__(self):
         """Initialize registry manager"""
         self.issues: List[RegistryIssue] = []
+        # Path existence results for the current scan; many entries share paths
+        self._exists_cache: Dict[str, bool] = {}
         self.backup_dir = "registry_backups"
 
     def _require_windows(self):
@@ -68,23 +89,38 @@ class RegistryManager:
             backup_name = f"registry_backup_{timestamp}.reg"
 
         backup_path = os.path.join(self.backup_dir, backup_name)
+        compressed_path = backup_path + ".gz"
 
+        # reg export can only write to a named file, so the export lands in a
+        # scratch file and is gzipped from there; the UTF-16 text compresses
+        # by an order of magnitude
         try:
             subprocess.run(
                 ["reg", "export", "HKLM", backup_path, "/y"],
                 check=True,
                 capture_output=True,
             )
-            return backup_path
-        except subprocess.CalledProcessError:
+            with open(backup_path, "rb") as src, gzip.open(compressed_path, "wb", compresslevel=3) as dst:
+                shutil.copyfileobj(src, dst, self.BACKUP_COPY_CHUNK)
+            return compressed_path
+        except (subprocess.CalledProcessError, OSError):
+            try:
+                os.remove(compressed_path)
+            except OSError:
+                pass
             return None
+        finally:
+            try:
+                os.remove(backup_path)
+            except OSError:
+                pass
 
     def restore_registry(self, backup_path: str) -> bool:
         """
         Restore registry from backup
 
         Args:
-            backup_path: Path to backup .reg file
+            backup_path: Path to backup .reg or .reg.gz file
 
         Returns:
             True if successful
@@ -93,24 +129,91 @@ class RegistryManager:
         if not os.path.exists(backup_path):
             return False
 
+        import_path = backup_path
         try:
+            if backup_path.lower().endswith(".gz"):
+                # reg import needs a plain file; decompress next to the backups
+                fd, import_path = tempfile.mkstemp(suffix=".reg", dir=self.backup_dir)
+                with os.fdopen(fd, "wb") as dst, gzip.open(backup_path, "rb") as src:
+                    shutil.copyfileobj(src, dst, self.BACKUP_COPY_CHUNK)
+
             subprocess.run(
-                ["reg", "import", backup_path],
+                ["reg", "import", import_path],
                 check=True,
                 capture_output=True,
             )
             return True
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
             return False
+        finally:
+            if import_path != backup_path:
+                try:
+                    os.remove(import_path)
+                except OSError:
+                    pass
 
     def _check_file_exists(self, filepath: str) -> bool:
-        """Check if file path exists"""
+        """Check if file path exists (cached for the current scan)"""
         if not filepath:
             return True  # Empty path is not an issue
 
         filepath = filepath.strip('"').strip("'")
-        filepath = os.path.expandvars(filepath)
-        return os.path.exists(filepath)
+        if "%" in filepath or "$" in filepath:
+            filepath = os.path.expandvars(filepath)
+        filepath = os.path.normcase(filepath)
+
+        cache = self._exists_cache
+        exists = cache.get(filepath)
+        if exists is None:
+            # A parent already known to be missing settles it without a stat
+            if cache.get(os.path.dirname(filepath)) is False:
+                exists = False
+            else:
+                exists = os.path.exists(filepath)
+            cache[filepath] = exists
+        return exists
+
+    def _probe_uninstall_subkey(self, hkey, path: str, subkey_name: str) -> List[RegistryIssue]:
+        """Check one Uninstall subkey for dangling icon and install paths"""
+        issues: List[RegistryIssue] = []
+        subkey_path = f"{path}\\{subkey_name}"
+
+        try:
+            # One sweep over all values instead of a lookup per value; names
+            # are lowercased as registry lookups are case-insensitive
+            values = {
+                value_name.lower(): value_data
+                for value_name, value_data, _ in enum_values(hkey, subkey_path, self._OPEN_FLAGS)
+            }
+        except OSError:
+            # Subkey vanished or is not readable; keep going
+            return issues
+
+        icon_path = values.get("displayicon")
+        if icon_path and not self._check_file_exists(icon_path.split(",")[0]):
+            issues.append(
+                RegistryIssue(
+                    key_path=subkey_path,
+                    value_name="DisplayIcon",
+                    issue_type="invalid_path",
+                    description=f"Invalid icon path: {icon_path}",
+                    hkey=hkey,
+                )
+            )
+
+        install_loc = values.get("installlocation")
+        if install_loc and not self._check_file_exists(install_loc):
+            issues.append(
+                RegistryIssue(
+                    key_path=subkey_path,
+                    value_name="InstallLocation",
+                    issue_type="invalid_path",
+                    description=f"Invalid install location: {install_loc}",
+                    hkey=hkey,
+                )
+            )
+
+        return issues
 
     def scan_uninstall_entries(self) -> List[RegistryIssue]:
         """Scan for orphaned uninstall entries"""
@@ -122,49 +225,17 @@ class RegistryManager:
             (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
         ]
 
-        for hkey, path in uninstall_paths:
-            try:
-                with winreg.OpenKey(hkey, path) as key:
-                    index = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, index)
-                            subkey_path = f"{path}\\{subkey_name}"
-
-                            with winreg.OpenKey(hkey, subkey_path) as subkey:
-                                try:
-                                    icon_path = winreg.QueryValueEx(subkey, "DisplayIcon")[0]
-                                    if icon_path and not self._check_file_exists(icon_path.split(",")[0]):
-                                        issues.append(
-                                            RegistryIssue(
-                                                key_path=subkey_path,
-                                                value_name="DisplayIcon",
-                                                issue_type="invalid_path",
-                                                description=f"Invalid icon path: {icon_path}",
-                                            )
-                                        )
-                                except FileNotFoundError:
-                                    pass
-
-                                try:
-                                    install_loc = winreg.QueryValueEx(subkey, "InstallLocation")[0]
-                                    if install_loc and not self._check_file_exists(install_loc):
-                                        issues.append(
-                                            RegistryIssue(
-                                                key_path=subkey_path,
-                                                value_name="InstallLocation",
-                                                issue_type="invalid_path",
-                                                description=f"Invalid install location: {install_loc}",
-                                            )
-                                        )
-                                except FileNotFoundError:
-                                    pass
-
-                            index += 1
-                        except OSError:
-                            break
-            except (OSError, PermissionError):
-                continue
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for hkey, path in uninstall_paths:
+                # Enumerate all names in one call first, then probe subkeys on the pool
+                try:
+                    subkey_names = enum_subkeys(hkey, path, self._OPEN_FLAGS)
+                except (OSError, PermissionError):
+                    continue
+
+                probe = partial(self._probe_uninstall_subkey, hkey, path)
+                for subkey_issues in executor.map(probe, subkey_names):
+                    issues.extend(subkey_issues)
 
         return issues
 
@@ -180,29 +251,24 @@ class RegistryManager:
 
         for hkey, path in startup_paths:
             try:
-                with winreg.OpenKey(hkey, path) as key:
-                    index = 0
-                    while True:
-                        try:
-                            value_name, value_data, _ = winreg.EnumValue(key, index)
-                            exe_path = value_data.strip('"').split()[0] if value_data else ""
-
-                            if exe_path and not self._check_file_exists(exe_path):
-                                issues.append(
-                                    RegistryIssue(
-                                        key_path=path,
-                                        value_name=value_name,
-                                        issue_type="missing_file",
-                                        description=f"Startup program not found: {exe_path}",
-                                    )
-                                )
-
-                            index += 1
-                        except OSError:
-                            break
+                values = enum_values(hkey, path, self._OPEN_FLAGS)
             except (OSError, PermissionError):
                 continue
 
+            for value_name, value_data, _ in values:
+                exe_path = value_data.strip('"').split()[0] if value_data else ""
+
+                if exe_path and not self._check_file_exists(exe_path):
+                    issues.append(
+                        RegistryIssue(
+                            key_path=path,
+                            value_name=value_name,
+                            issue_type="missing_file",
+                            description=f"Startup program not found: {exe_path}",
+                            hkey=hkey,
+                        )
+                    )
+
         return issues
 
     def scan_registry_issues(self) -> List[RegistryIssue]:
@@ -214,6 +280,7 @@ class RegistryManager:
         """
         self._require_windows()
         self.issues = []
+        self._exists_cache.clear()
         self.issues.extend(self.scan_uninstall_entries())
         self.issues.extend(self.scan_startup_entries())
         return self.issues
@@ -230,14 +297,17 @@ class RegistryManager:
         """
         self._require_windows()
         try:
-            if issue.key_path.startswith("HKEY_LOCAL_MACHINE") or "SOFTWARE" in issue.key_path:
-                hkey = winreg.HKEY_LOCAL_MACHINE
-            else:
-                hkey = winreg.HKEY_CURRENT_USER
+            # Hive recorded at scan time, else parsed from the path
+            hkey = issue.hkey
+            if hkey is None:
+                if issue.key_path.startswith(("HKEY_CURRENT_USER\\", "HKCU\\")):
+                    hkey = winreg.HKEY_CURRENT_USER
+                else:
+                    hkey = winreg.HKEY_LOCAL_MACHINE
 
             key_path = issue.key_path.replace("HKEY_LOCAL_MACHINE\\", "").replace("HKEY_CURRENT_USER\\", "")
 
-            with winreg.OpenKey(hkey, key_path, 0, winreg.KEY_SET_VALUE) as key:
+            with winreg.OpenKey(hkey, key_path, 0, winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY) as key:
                 winreg.DeleteValue(key, issue.value_name)
 
             return True
@@ -3,9 +3,91 @@ Secure file deletion with multiple overwrite passes
 Implements DOD 5220.22-M and Gutmann methods
 """
 import os
-import random
+import stat
+import ctypes
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Callable, Optional
 
+# Data-only barrier where available: the overwrite must reach the device,
+# but the file's timestamps need not be journaled on every pass
+_sync_data = getattr(os, 'fdatasync', os.fsync)
+
+try:
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+except (AttributeError, OSError, ValueError):
+    _kernel32 = None
+
+GENERIC_WRITE = 0x40000000
+FILE_SHARE_READ_WRITE = 0x00000003
+OPEN_EXISTING = 3
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+FSCTL_SET_SPARSE = 0x000900C4
+FSCTL_SET_ZERO_DATA = 0x000980C8
+IOCTL_STORAGE_QUERY_PROPERTY = 0x002D1400
+STORAGE_DEVICE_TRIM_PROPERTY = 8
+PROPERTY_STANDARD_QUERY = 0
+
+
+class _FileZeroDataInformation(ctypes.Structure):
+    """FILE_ZERO_DATA_INFORMATION"""
+    _fields_ = [
+        ('FileOffset', ctypes.c_int64),
+        ('BeyondFinalZero', ctypes.c_int64),
+    ]
+
+
+class _StoragePropertyQuery(ctypes.Structure):
+    """STORAGE_PROPERTY_QUERY"""
+    _fields_ = [
+        ('PropertyId', ctypes.c_uint32),
+        ('QueryType', ctypes.c_uint32),
+        ('AdditionalParameters', ctypes.c_ubyte * 1),
+    ]
+
+
+class _DeviceTrimDescriptor(ctypes.Structure):
+    """DEVICE_TRIM_DESCRIPTOR"""
+    _fields_ = [
+        ('Version', ctypes.c_uint32),
+        ('Size', ctypes.c_uint32),
+        ('TrimEnabled', ctypes.c_ubyte),
+    ]
+
+
+if _kernel32 is not None:
+    _kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE,
+    ]
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.DeviceIoControl.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p,
+    ]
+    _kernel32.DeviceIoControl.restype = wintypes.BOOL
+    _kernel32.FlushFileBuffers.argtypes = [wintypes.HANDLE]
+    _kernel32.FlushFileBuffers.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+
+def _device_io_control(handle, code: int, in_buf=None, out_buf=None) -> bool:
+    """Issue one DeviceIoControl call with optional ctypes in/out structures"""
+    returned = wintypes.DWORD()
+    return bool(_kernel32.DeviceIoControl(
+        handle, code,
+        ctypes.byref(in_buf) if in_buf is not None else None,
+        ctypes.sizeof(in_buf) if in_buf is not None else 0,
+        ctypes.byref(out_buf) if out_buf is not None else None,
+        ctypes.sizeof(out_buf) if out_buf is not None else 0,
+        ctypes.byref(returned), None,
+    ))
+
 
 class SecureDelete:
     """Secure file deletion with multiple overwrite passes"""
@@ -35,47 +117,68 @@ class SecureDelete:
         b'\xFF' * 512,  # Pattern 21
     ]
     
+    # Patterns are tiled to this size so each pass issues few large writes
+    WRITE_CHUNK_SIZE = 4 * 1024 * 1024
+    
+    # Files in a folder are overwritten concurrently to keep the write queue full
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(self):
         """Initialize secure delete"""
-        pass
+        # Fixed patterns tiled to write blocks, reused across passes and files
+        self._blocks = {}
+        # TRIM support per drive, queried once; folder workers share it
+        self._trim_drives = {}
+        self._trim_lock = threading.Lock()
+    
+    def _tile(self, pattern: bytes) -> bytes:
+        """
+        Repeat a fixed pattern into one write block (cached)
+        
+        Whole repeats keep multi-byte patterns in phase across blocks.
+        """
+        block = self._blocks.get(pattern)
+        if block is None:
+            block = pattern * max(1, self.WRITE_CHUNK_SIZE // len(pattern))
+            self._blocks[pattern] = block
+        return block
     
-    def _overwrite_file(
+    def _overwrite_file_buf(
         self,
         filepath: str,
-        pattern: bytes,
+        block: bytes,
+        file_size: int,
         callback: Optional[Callable[[int, int], None]] = None
     ) -> bool:
         """
-        Overwrite file with specific pattern
+        Overwrite file by repeating a prebuilt block
         
         Args:
             filepath: Path to file
-            pattern: Byte pattern to write
+            block: Data to write, repeated until file_size is covered
+            file_size: Size of the file
             callback: Progress callback(current_byte, total_bytes)
         
         Returns:
             True if successful
         """
         try:
-            file_size = os.path.getsize(filepath)
+            view = memoryview(block)
+            block_size = len(block)
             
-            with open(filepath, 'rb+') as f:
+            # Unbuffered: blocks go straight to the OS without an extra copy
+            with open(filepath, 'rb+', buffering=0) as f:
                 bytes_written = 0
-                chunk_size = len(pattern)
                 
                 while bytes_written < file_size:
-                    remaining = file_size - bytes_written
-                    write_size = min(chunk_size, remaining)
-                    
-                    f.write(pattern[:write_size])
-                    bytes_written += write_size
+                    write_size = min(block_size, file_size - bytes_written)
+                    bytes_written += f.write(view[:write_size])
                     
                     if callback:
                         callback(bytes_written, file_size)
                 
-                # Flush to disk
-                f.flush()
-                os.fsync(f.fileno())
+                # Flush to disk before the next pass overwrites the page cache
+                _sync_data(f.fileno())
             
             return True
         
@@ -83,76 +186,160 @@ class SecureDelete:
             return False
     
     def _random_pattern(self, size: int = 512) -> bytes:
-        """Generate random byte pattern"""
-        return bytes(random.randint(0, 255) for _ in range(size))
+        """Generate random byte pattern (kernel CSPRNG, one call)"""
+        return os.urandom(size)
+    
+    def _trim_supported(self, filepath: str) -> bool:
+        """Check whether the drive holding filepath is a TRIM-enabled device"""
+        if _kernel32 is None:
+            return False
+        
+        drive = os.path.splitdrive(os.path.abspath(filepath))[0].upper()
+        if not drive:
+            return False
+        
+        # Held across the probe so each drive is queried only once
+        with self._trim_lock:
+            supported = self._trim_drives.get(drive)
+            if supported is None:
+                supported = False
+                handle = _kernel32.CreateFileW(
+                    f'\\\\.\\{drive}', 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None
+                )
+                if handle not in (None, INVALID_HANDLE_VALUE):
+                    try:
+                        query = _StoragePropertyQuery(STORAGE_DEVICE_TRIM_PROPERTY, PROPERTY_STANDARD_QUERY)
+                        descriptor = _DeviceTrimDescriptor()
+                        if _device_io_control(handle, IOCTL_STORAGE_QUERY_PROPERTY, query, descriptor):
+                            supported = bool(descriptor.TrimEnabled)
+                    finally:
+                        _kernel32.CloseHandle(handle)
+                self._trim_drives[drive] = supported
+        return supported
+    
+    def _zero_file_trim(self, filepath: str, file_size: int) -> bool:
+        """
+        Deallocate a file's data in place on NTFS
+        
+        The file is marked sparse and its whole range zeroed with
+        FSCTL_SET_ZERO_DATA, so the file system releases the clusters and
+        TRIMs them on the device instead of rewriting every byte.
+        
+        Returns:
+            True if the range was zeroed
+        """
+        if _kernel32 is None:
+            return False
+        
+        handle = _kernel32.CreateFileW(
+            filepath, GENERIC_WRITE, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None
+        )
+        if handle in (None, INVALID_HANDLE_VALUE):
+            return False
+        
+        try:
+            if not _device_io_control(handle, FSCTL_SET_SPARSE):
+                return False
+            
+            zero_range = _FileZeroDataInformation(0, file_size)
+            if not _device_io_control(handle, FSCTL_SET_ZERO_DATA, zero_range):
+                return False
+            
+            return bool(_kernel32.FlushFileBuffers(handle))
+        finally:
+            _kernel32.CloseHandle(handle)
     
     def secure_delete_file(
         self,
         filepath: str,
         passes: int = 3,
-        callback: Optional[Callable[[int, int, str], None]] = None
+        callback: Optional[Callable[[int, int, str], None]] = None,
+        method: str = 'auto'
     ) -> bool:
         """
         Securely delete file with multiple overwrite passes
         
+        On TRIM-enabled drives, overwriting does not reliably reach the cells
+        that held the data (the controller remaps writes), so there the data
+        range is deallocated and trimmed instead.
+        
         Args:
             filepath: Path to file to delete
             passes: Number of overwrite passes (1, 3, 7, or 35 for Gutmann)
             callback: Progress callback(current_pass, total_passes, status)
+            method: 'overwrite', 'trim', or 'auto' to trim on TRIM-enabled drives
         
         Returns:
             True if file was successfully deleted
         """
-        if not os.path.exists(filepath) or not os.path.isfile(filepath):
+        # One stat answers existence, type and size
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return False
+        
+        if not stat.S_ISREG(st.st_mode):
             return False
         
         try:
-            file_size = os.path.getsize(filepath)
+            file_size = st.st_size
+            
+            # Random passes (None) get fresh data covering the file, up to one
+            # block, generated as each pass starts
+            random_size = max(1, min(file_size, self.WRITE_CHUNK_SIZE))
             
             # Determine patterns based on passes
             if passes == 1:
-                patterns = [self._random_pattern()]
+                patterns = [None]
             elif passes == 3:
                 # DOD 5220.22-M standard
                 patterns = [
                     b'\x00' * 512,  # Pass 1: zeros
                     b'\xFF' * 512,  # Pass 2: ones
-                    self._random_pattern()  # Pass 3: random
+                    None  # Pass 3: random
                 ]
             elif passes == 7:
                 # Extended DOD
                 patterns = [
-                    self._random_pattern(),
-                    self._random_pattern(),
+                    None,
+                    None,
                     b'\x00' * 512,
                     b'\xFF' * 512,
-                    self._random_pattern(),
-                    self._random_pattern(),
-                    self._random_pattern()
+                    None,
+                    None,
+                    None
                 ]
             elif passes == 35:
                 # Gutmann method (simplified)
-                patterns = (
-                    [self._random_pattern() for _ in range(4)] +
-                    self.GUTMANN_PATTERNS +
-                    [self._random_pattern() for _ in range(10)]
-                )
+                patterns = [None] * 4 + self.GUTMANN_PATTERNS + [None] * 10
             else:
                 # Default to 3 passes
-                patterns = [self._random_pattern() for _ in range(passes)]
+                patterns = [None] * passes
+            
+            trimmed = False
+            if method == 'trim' or (method == 'auto' and self._trim_supported(filepath)):
+                if callback:
+                    callback(1, len(patterns), "Trimming file data")
+                # Falls back to the overwrite passes if the volume refuses
+                trimmed = self._zero_file_trim(filepath, file_size)
             
             # Perform overwrite passes
-            for i, pattern in enumerate(patterns):
+            for i, pattern in enumerate(() if trimmed else patterns):
                 if callback:
                     callback(i + 1, len(patterns), f"Overwriting pass {i + 1}/{len(patterns)}")
                 
-                success = self._overwrite_file(filepath, pattern)
+                if pattern is None:
+                    block = self._random_pattern(random_size)
+                else:
+                    block = self._tile(pattern)
+                
+                success = self._overwrite_file_buf(filepath, block, file_size)
                 if not success:
                     return False
             
             # Rename file to random name before deletion
             directory = os.path.dirname(filepath)
-            random_name = ''.join(random.choices('0123456789abcdef', k=16))
+            random_name = os.urandom(8).hex()
             new_path = os.path.join(directory, random_name)
             
             try:
@@ -178,7 +365,8 @@ class SecureDelete:
         self,
         folderpath: str,
         passes: int = 3,
-        callback: Optional[Callable[[str, int, int], None]] = None
+        callback: Optional[Callable[[str, int, int], None]] = None,
+        method: str = 'auto'
     ) -> bool:
         """
         Securely delete all files in folder
@@ -187,6 +375,7 @@ class SecureDelete:
             folderpath: Path to folder
             passes: Number of overwrite passes
             callback: Progress callback(current_file, file_index, total_files)
+            method: Deletion method, as for secure_delete_file
         
         Returns:
             True if all files were deleted
@@ -194,32 +383,63 @@ class SecureDelete:
         if not os.path.exists(folderpath) or not os.path.isdir(folderpath):
             return False
         
-        # Collect all files
+        # Walk once: files to overwrite, then directories to remove. Links
+        # that resolve to an already-listed file or directory are kept aside
+        # so the same data is never overwritten twice.
         all_files = []
+        all_dirs = []
+        aliases = []
+        seen_real = set()
+        seen_real_dirs = {os.path.normcase(os.path.realpath(folderpath))}
         for root, dirs, files in os.walk(folderpath):
             for filename in files:
-                all_files.append(os.path.join(root, filename))
+                path = os.path.join(root, filename)
+                real = os.path.normcase(os.path.realpath(path))
+                if real in seen_real:
+                    aliases.append(path)
+                else:
+                    seen_real.add(real)
+                    all_files.append(path)
+            
+            kept = []
+            for dirname in dirs:
+                path = os.path.join(root, dirname)
+                all_dirs.append(path)
+                real = os.path.normcase(os.path.realpath(path))
+                if real not in seen_real_dirs:
+                    seen_real_dirs.add(real)
+                    kept.append(dirname)
+            dirs[:] = kept
         
         total_files = len(all_files)
         success_count = 0
         
-        # Delete each file
-        for i, filepath in enumerate(all_files):
-            if callback:
-                callback(filepath, i + 1, total_files)
+        # Delete files on the pool; results and callbacks stay in walk order
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = executor.map(partial(self.secure_delete_file, passes=passes, method=method), all_files)
             
-            if self.secure_delete_file(filepath, passes):
-                success_count += 1
+            for i, (filepath, deleted) in enumerate(zip(all_files, results)):
+                if callback:
+                    callback(filepath, i + 1, total_files)
+                
+                if deleted:
+                    success_count += 1
         
-        # Remove empty directories
+        # The data behind each alias has been overwritten; just unlink it
+        for path in aliases:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        
+        # Remove empty directories. A top-down walk lists every directory
+        # before its children, so the reversed list is deepest-first.
         try:
-            for root, dirs, files in os.walk(folderpath, topdown=False):
-                for dirname in dirs:
-                    dirpath = os.path.join(root, dirname)
-                    try:
-                        os.rmdir(dirpath)
-                    except OSError:
-                        pass
+            for dirpath in reversed(all_dirs):
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
             
             # Remove root folder
             os.rmdir(folderpath)
@@ -4,16 +4,21 @@ The module degrades gracefully on non-Windows platforms.
 """
 import os
 import platform
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple
 
 try:
     import winreg  # type: ignore
 except ImportError:
     winreg = None
 
+from core._winreg_fast import enum_subkeys, enum_values
+
 IS_WINDOWS = platform.system() == "Windows" and winreg is not None
 
 
@@ -60,6 +65,20 @@ class SoftwareManager:
         "Hotfix for",
         "KB",
     ]
+    # One case-insensitive scan over all markers instead of a loop per name
+    _SYSTEM_RE = re.compile("|".join(re.escape(s.lower()) for s in SYSTEM_SOFTWARE))
+
+    # Open keys in the 64-bit view explicitly so a 32-bit interpreter is not
+    # silently redirected to WOW6432Node, which is listed on its own. Set to
+    # KEY_READ | KEY_WOW64_32KEY to read the 32-bit view instead.
+    _OPEN_FLAGS = winreg.KEY_READ | winreg.KEY_WOW64_64KEY if IS_WINDOWS else 0
+
+    # winreg releases the GIL around registry calls, so subkeys are read
+    # concurrently to overlap their kernel-side latency
+    MAX_WORKERS = 16
+
+    # Directory levels below an install location searched for executables
+    LAST_USED_MAX_DEPTH = 3
 
     def __init__(self, show_system_software: bool = False):
         """
@@ -70,6 +89,9 @@ class SoftwareManager:
         """
         self.show_system_software = show_system_software
         self.software_list: List[SoftwareInfo] = []
+        # Last-used estimates per (install dir, threshold); related SKUs
+        # share locations
+        self._last_used_cache: Dict[Tuple[str, Optional[int]], Optional[datetime]] = {}
 
     def _require_windows(self):
         if not IS_WINDOWS:
@@ -80,14 +102,18 @@ class SoftwareManager:
         if self.show_system_software:
             return False
 
-        name_lower = name.lower()
-        for system_name in self.SYSTEM_SOFTWARE:
-            if system_name.lower() in name_lower:
-                return True
-        return False
+        return self._is_system_name(name.lower())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_system_name(name_lower: str) -> bool:
+        """Match a lowercased display name (64-bit and WOW6432Node views repeat names)"""
+        return SoftwareManager._SYSTEM_RE.search(name_lower) is not None
 
-    def _parse_install_date(self, date_str: str) -> Optional[datetime]:
-        """Parse install date from registry (YYYYMMDD format)"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_install_date(date_str: str) -> Optional[datetime]:
+        """Parse install date from registry (YYYYMMDD format, cached as dates repeat)"""
         if not date_str or len(date_str) != 8:
             return None
 
@@ -103,57 +129,36 @@ class SoftwareManager:
         """Read software info from registry key"""
         if not IS_WINDOWS:
             return None
+        key_path = f"{path}\\{subkey_name}"
         try:
-            with winreg.OpenKey(hkey, f"{path}\\{subkey_name}") as key:
-                try:
-                    name = winreg.QueryValueEx(key, "DisplayName")[0]
-                except FileNotFoundError:
-                    return None
+            # Names are lowercased, as registry value lookups are case-insensitive
+            values = {
+                value_name.lower(): value_data
+                for value_name, value_data, _ in enum_values(hkey, key_path, self._OPEN_FLAGS)
+            }
 
-                if self._is_system_software(name):
-                    return None
+            name = values.get("displayname")
+            if name is None:
+                return None
 
-                try:
-                    version = winreg.QueryValueEx(key, "DisplayVersion")[0]
-                except FileNotFoundError:
-                    version = ""
-
-                try:
-                    publisher = winreg.QueryValueEx(key, "Publisher")[0]
-                except FileNotFoundError:
-                    publisher = ""
+            if self._is_system_software(name):
+                return None
 
-                try:
-                    install_date_str = winreg.QueryValueEx(key, "InstallDate")[0]
-                    install_date = self._parse_install_date(install_date_str)
-                except FileNotFoundError:
-                    install_date = None
-
-                try:
-                    install_location = winreg.QueryValueEx(key, "InstallLocation")[0]
-                except FileNotFoundError:
-                    install_location = None
-
-                try:
-                    uninstall_string = winreg.QueryValueEx(key, "UninstallString")[0]
-                except FileNotFoundError:
-                    uninstall_string = None
-
-                try:
-                    size = int(winreg.QueryValueEx(key, "EstimatedSize")[0])
-                except (FileNotFoundError, ValueError, TypeError):
-                    size = 0
-
-                return SoftwareInfo(
-                    name=name,
-                    version=version,
-                    publisher=publisher,
-                    install_date=install_date,
-                    install_location=install_location,
-                    uninstall_string=uninstall_string,
-                    estimated_size=size,
-                    registry_key=f"{path}\\{subkey_name}",
-                )
+            try:
+                size = int(values.get("estimatedsize", 0) or 0)
+            except (ValueError, TypeError):
+                size = 0
+
+            return SoftwareInfo(
+                name=name,
+                version=values.get("displayversion", ""),
+                publisher=values.get("publisher", ""),
+                install_date=self._parse_install_date(values.get("installdate")),
+                install_location=values.get("installlocation"),
+                uninstall_string=values.get("uninstallstring"),
+                estimated_size=size,
+                registry_key=key_path,
+            )
 
         except (OSError, PermissionError):
             return None
@@ -170,57 +175,95 @@ class SoftwareManager:
             return self.software_list
 
         self.software_list = []
+        self._last_used_cache.clear()
         seen_names = set()
+        # Product GUID subkeys ({...}) repeat between the native and
+        # WOW6432Node views; only the first one is opened. Other names, such
+        # as "7-Zip", can be separate 32-bit and 64-bit installs.
+        seen_guids = set()
 
-        for path in self.UNINSTALL_PATHS:
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
-                    index = 0
-                    while True:
-                        try:
-                            subkey_name = winreg.EnumKey(key, index)
-                            software = self._read_registry_key(winreg.HKEY_LOCAL_MACHINE, path, subkey_name)
+        hkey = winreg.HKEY_LOCAL_MACHINE
 
-                            if software and software.name not in seen_names:
-                                self.software_list.append(software)
-                                seen_names.add(software.name)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for path in self.UNINSTALL_PATHS:
+                # List all subkey names first, then read subkeys on the pool
+                try:
+                    all_names = enum_subkeys(hkey, path, self._OPEN_FLAGS)
+                except (OSError, PermissionError):
+                    continue
+
+                subkey_names = []
+                for subkey_name in all_names:
+                    if subkey_name.startswith("{") and subkey_name.endswith("}"):
+                        guid = subkey_name.lower()
+                        if guid in seen_guids:
+                            continue
+                        seen_guids.add(guid)
+                    subkey_names.append(subkey_name)
 
-                            index += 1
-                        except OSError:
-                            break
-            except (OSError, PermissionError):
-                continue
+                read_key = partial(self._read_registry_key, hkey, path)
+                for software in executor.map(read_key, subkey_names):
+                    if software and software.name not in seen_names:
+                        self.software_list.append(software)
+                        seen_names.add(software.name)
 
         self.software_list.sort(key=lambda s: s.name.lower())
         return self.software_list
 
-    def get_software_last_used(self, install_location: str) -> Optional[datetime]:
+    def get_software_last_used(
+        self, install_location: str, threshold_days: Optional[int] = None
+    ) -> Optional[datetime]:
         """
         Estimate last usage date by checking file modification times
+
+        Executables are looked for up to LAST_USED_MAX_DEPTH directories below
+        the install location. With threshold_days, the scan stops at the first
+        executable newer than the threshold and returns its time, which is
+        all is_software_unused needs.
         """
-        if not install_location or not os.path.exists(install_location):
+        if not install_location:
             return None
 
-        latest_time = None
-        try:
-            for root, dirs, files in os.walk(install_location):
-                for filename in files:
-                    if filename.endswith(".exe"):
-                        filepath = os.path.join(root, filename)
+        cache_key = (os.path.normcase(install_location), threshold_days)
+        if cache_key in self._last_used_cache:
+            return self._last_used_cache[cache_key]
+
+        threshold = None
+        if threshold_days is not None:
+            threshold = (datetime.now() - timedelta(days=threshold_days)).timestamp()
+
+        latest_mtime = None
+        # scandir entries carry the file type, and on Windows the stat data,
+        # from the directory listing itself
+        pending = [(install_location, 0)]
+        while pending:
+            directory, depth = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
                         try:
-                            mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-                            if latest_time is None or mtime > latest_time:
-                                latest_time = mtime
-                        except (OSError, PermissionError):
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < self.LAST_USED_MAX_DEPTH:
+                                    pending.append((entry.path, depth + 1))
+                            elif entry.name.lower().endswith(".exe"):
+                                mtime = entry.stat().st_mtime
+                                if latest_mtime is None or mtime > latest_mtime:
+                                    latest_mtime = mtime
+                                if threshold is not None and mtime > threshold:
+                                    pending.clear()
+                                    break
+                        except OSError:
                             continue
-        except (OSError, PermissionError):
-            pass
+            except OSError:
+                continue
 
+        latest_time = datetime.fromtimestamp(latest_mtime) if latest_mtime is not None else None
+        self._last_used_cache[cache_key] = latest_time
         return latest_time
 
     def is_software_unused(self, software: SoftwareInfo, threshold_days: int = 90) -> bool:
         """Check if software appears unused"""
-        last_used = self.get_software_last_used(software.install_location)
+        last_used = self.get_software_last_used(software.install_location, threshold_days)
 
         if last_used is None:
             return False
@@ -228,6 +271,26 @@ class SoftwareManager:
         threshold_date = datetime.now() - timedelta(days=threshold_days)
         return last_used < threshold_date
 
+    def classify_unused(
+        self, software_list: List[SoftwareInfo], threshold_days: int = 90
+    ) -> Dict[str, bool]:
+        """
+        Check many programs for disuse at once
+
+        Install locations are scanned concurrently on a thread pool.
+
+        Returns:
+            Mapping of software name to whether it appears unused
+        """
+        locations = {s.name: s.install_location for s in software_list if s.install_location}
+        threshold_date = datetime.now() - timedelta(days=threshold_days)
+
+        last_used = partial(self.get_software_last_used, threshold_days=threshold_days)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = dict(zip(locations, executor.map(last_used, locations.values())))
+
+        return {name: t is not None and t < threshold_date for name, t in results.items()}
+
     def uninstall_software(self, software: SoftwareInfo) -> bool:
         """Uninstall software using its uninstall string"""
         if not IS_WINDOWS:
@@ -235,6 +298,17 @@ class SoftwareManager:
         if not software.uninstall_string:
             return False
 
+        # CreateProcess parses the command line itself, quoted paths included,
+        # so no cmd.exe is needed; the shell is only a fallback for strings
+        # it cannot run directly. Console uninstallers get their own console
+        # so they can prompt.
+        command = os.path.expandvars(software.uninstall_string)
+        try:
+            subprocess.Popen(command, creationflags=subprocess.CREATE_NEW_CONSOLE)
+            return True
+        except OSError:
+            pass
+
         try:
             subprocess.Popen(software.uninstall_string, shell=True)
             return True
@@ -4,47 +4,66 @@ Cleaner tab - System cleaning interface
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QGroupBox, QCheckBox, QProgressBar,
                              QPlainTextEdit, QMessageBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
 from core.cleaner import SystemCleaner
+from gui.workers import PoolRunnable
 from utils.config import get_config
 from utils.logger import get_logger
 
 
 
-class CleaningThread(QThread):
-    """Background thread for cleaning operations"""
+class _CleaningSignals(QObject):
     progress = pyqtSignal(str)
     finished = pyqtSignal(dict)
+
+
+class CleaningRunnable(PoolRunnable):
+    """Background runnable for cleaning operations"""
+    SIGNALS = _CleaningSignals
     
-    def __init__(self, options, analyze_only=False):
+    def __init__(self, options):
         super().__init__()
         self.options = options
-        self.analyze_only = analyze_only
     
-    def run(self):
+    def work(self):
         """Run cleaning operation"""
         cleaner = SystemCleaner()
-        
-        if not self.analyze_only:
-            results = cleaner.clean_all(self.options)
-            stats = cleaner.get_total_statistics()
-            self.finished.emit(stats)
-        else:
-            # Just analyze, don't clean
-            self.progress.emit("Analyzing system...")
-            self.finished.emit({'analyzed': True})
+        results = cleaner.clean_all(self.options)
+        stats = cleaner.get_total_statistics()
+        self.finished.emit(stats)
 
 
 class CleanerTab(QWidget):
     """System cleaner tab"""
     
+    # Log lines are buffered and appended at most this often (ms)
+    LOG_FLUSH_INTERVAL_MS = 50
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.config = get_config()
         self.logger = get_logger()
-        self.cleaning_thread = None
+        self.cleaning_runnable = None
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
         self.init_ui()
     
+    def _log(self, line: str):
+        """Queue a line for the log view"""
+        self._log_buf.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append queued log lines in one document update"""
+        if self._log_buf:
+            self.log_text.appendPlainText('\n'.join(self._log_buf))
+            self._log_buf.clear()
+        else:
+            self._log_timer.stop()
+    
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
@@ -60,24 +79,26 @@ class CleanerTab(QWidget):
         options_layout = QVBoxLayout()
         options_group.setLayout(options_layout)
         
+        cfg = self.config.get
+        
         self.temp_files_cb = QCheckBox("Temporary Files")
-        self.temp_files_cb.setChecked(self.config.get('cleaning.temp_files', True))
+        self.temp_files_cb.setChecked(cfg('cleaning.temp_files', True))
         options_layout.addWidget(self.temp_files_cb)
         
         self.browser_cache_cb = QCheckBox("Browser Cache")
-        self.browser_cache_cb.setChecked(self.config.get('cleaning.browser_cache', True))
+        self.browser_cache_cb.setChecked(cfg('cleaning.browser_cache', True))
         options_layout.addWidget(self.browser_cache_cb)
         
         self.recycle_bin_cb = QCheckBox("Recycle Bin")
-        self.recycle_bin_cb.setChecked(self.config.get('cleaning.recycle_bin', False))
+        self.recycle_bin_cb.setChecked(cfg('cleaning.recycle_bin', False))
         options_layout.addWidget(self.recycle_bin_cb)
         
         self.recent_files_cb = QCheckBox("Recent Files")
-        self.recent_files_cb.setChecked(self.config.get('cleaning.recent_files', True))
+        self.recent_files_cb.setChecked(cfg('cleaning.recent_files', True))
         options_layout.addWidget(self.recent_files_cb)
         
         self.log_files_cb = QCheckBox("Windows Log Files")
-        self.log_files_cb.setChecked(self.config.get('cleaning.log_files', True))
+        self.log_files_cb.setChecked(cfg('cleaning.log_files', True))
         options_layout.addWidget(self.log_files_cb)
         
         layout.addWidget(options_group)
@@ -125,14 +146,12 @@ class CleanerTab(QWidget):
     
     def analyze(self):
         """Analyze system without cleaning"""
-        self.log_text.appendPlainText("Starting analysis...")
+        self._log("Starting analysis...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
         
-        options = self.get_options()
-        self.cleaning_thread = CleaningThread(options, analyze_only=True)
-        self.cleaning_thread.finished.connect(self.on_analyze_finished)
-        self.cleaning_thread.start()
+        # Analysis does no background work; finish on the next event loop pass
+        QTimer.singleShot(0, lambda: self.on_analyze_finished({'analyzed': True}))
     
     def clean(self):
         """Perform cleaning operation"""
@@ -146,7 +165,8 @@ class CleanerTab(QWidget):
         
         if reply == QMessageBox.Yes:
             self.log_text.clear()
-            self.log_text.appendPlainText("Starting cleaning operation...")
+            self._log_buf.clear()
+            self._log("Starting cleaning operation...")
             self.progress_bar.setVisible(True)
             self.progress_bar.setRange(0, 0)
             
@@ -154,14 +174,14 @@ class CleanerTab(QWidget):
             self.clean_btn.setEnabled(False)
             
             options = self.get_options()
-            self.cleaning_thread = CleaningThread(options, analyze_only=False)
-            self.cleaning_thread.finished.connect(self.on_clean_finished)
-            self.cleaning_thread.start()
+            self.cleaning_runnable = CleaningRunnable(options)
+            self.cleaning_runnable.finished.connect(self.on_clean_finished)
+            self.cleaning_runnable.start()
     
     def on_analyze_finished(self, stats):
         """Handle analyze completion"""
         self.progress_bar.setVisible(False)
-        self.log_text.appendPlainText("Analysis complete!")
+        self._log("Analysis complete!")
     
     def on_clean_finished(self, stats):
         """Handle cleaning completion"""
@@ -169,9 +189,9 @@ class CleanerTab(QWidget):
         self.analyze_btn.setEnabled(True)
         self.clean_btn.setEnabled(True)
         
-        self.log_text.appendPlainText(f"\nCleaning complete!")
-        self.log_text.appendPlainText(f"Files removed: {stats.get('total_files_removed', 0)}")
-        self.log_text.appendPlainText(f"Space freed: {stats.get('total_space_formatted', '0 B')}")
+        self._log(f"\nCleaning complete!")
+        self._log(f"Files removed: {stats.get('total_files_removed', 0)}")
+        self._log(f"Space freed: {stats.get('total_space_formatted', '0 B')}")
         
         self.logger.log_operation(
             "System Cleaning",
@@ -4,7 +4,6 @@ Dashboard tab - Overview and statistics
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QGroupBox, QGridLayout)
 from PyQt5.QtCore import Qt
-from core.optimizer import SystemOptimizer
 from utils.scanner import Scanner
 
 
@@ -15,8 +14,16 @@ class DashboardTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
+        # Newest resource sample, shown when the tab becomes visible
+        self._pending_stats = None
         self.init_ui()
     
+    def showEvent(self, event):
+        """Show the sample that arrived while the tab was hidden"""
+        super().showEvent(event)
+        if self._pending_stats is not None:
+            self.update_stats(self._pending_stats)
+    
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
@@ -72,27 +79,23 @@ class DashboardTab(QWidget):
         layout.addWidget(actions_group)
         
         layout.addStretch()
-        
-        # Update stats
-        self.update_stats()
     
-    def update_stats(self):
-        """Update dashboard statistics"""
-        try:
-            optimizer = SystemOptimizer()
-            stats = optimizer.get_system_resources()
-            
-            self.cpu_label.setText(f"CPU: {stats.cpu_percent:.1f}%")
-            self.memory_label.setText(
-                f"Memory: {stats.memory_percent:.1f}% "
-                f"({stats.memory_used_mb} / {stats.memory_total_mb} MB)"
-            )
-            self.disk_label.setText(
-                f"Disk: {stats.disk_percent:.1f}% "
-                f"({stats.disk_used_gb:.1f} / {stats.disk_total_gb:.1f} GB)"
-            )
-        except Exception as e:
-            print(f"Error updating stats: {e}")
+    def update_stats(self, stats):
+        """Show resource statistics polled by the main window's worker"""
+        if not self.isVisible():
+            # Labels are off screen; keep the sample for showEvent
+            self._pending_stats = stats
+            return
+        self._pending_stats = None
+        self.cpu_label.setText(f"CPU: {stats.cpu_percent:.1f}%")
+        self.memory_label.setText(
+            f"Memory: {stats.memory_percent:.1f}% "
+            f"({stats.memory_used_mb} / {stats.memory_total_mb} MB)"
+        )
+        self.disk_label.setText(
+            f"Disk: {stats.disk_percent:.1f}% "
+            f"({stats.disk_used_gb:.1f} / {stats.disk_total_gb:.1f} GB)"
+        )
     
     def quick_analyze(self):
         """Quick analyze action"""
@@ -102,4 +105,4 @@ class DashboardTab(QWidget):
     def quick_clean(self):
         """Quick clean action"""
         if self.parent_window:
-            self.parent_window.tabs.setCurrentWidget(self.parent_window.cleaner_tab)
+            self.parent_window.show_tab('cleaner_tab')
@@ -0,0 +1,28 @@
+"""
+Window-modal message boxes that do not block the caller
+
+QMessageBox.information/question run a nested event loop until the user
+answers; these open the box and return at once, and the answer arrives
+through a callback.
+"""
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QMessageBox
+
+
+def _open_box(parent, icon, title: str, text: str, buttons) -> QMessageBox:
+    box = QMessageBox(icon, title, text, buttons, parent)
+    box.setAttribute(Qt.WA_DeleteOnClose)
+    box.open()
+    return box
+
+
+def show_information(parent, title: str, text: str) -> QMessageBox:
+    """Show an information box"""
+    return _open_box(parent, QMessageBox.Information, title, text, QMessageBox.Ok)
+
+
+def ask_yes_no(parent, title: str, text: str, on_yes) -> QMessageBox:
+    """Ask a Yes/No question; on_yes() is called if the user answers Yes"""
+    box = _open_box(parent, QMessageBox.Question, title, text, QMessageBox.Yes | QMessageBox.No)
+    box.finished.connect(lambda result: on_yes() if result == QMessageBox.Yes else None)
+    return box
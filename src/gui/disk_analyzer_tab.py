@@ -4,21 +4,64 @@ Disk Analyzer Tab - Analyze disk space usage with tree view
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTreeWidget, QTreeWidgetItem, QFileDialog,
                              QMessageBox, QHeaderView, QProgressDialog, QSpinBox,
-                             QGroupBox, QApplication)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                             QGroupBox)
+from PyQt5.QtCore import Qt, QMutex, QObject, pyqtSignal
 from core.analyzer import DiskAnalyzer, DiskItem
+from core.cleaner import remove_tree
 from core.secure_delete import SecureDelete
+from gui.workers import PoolRunnable
 from utils.scanner import Scanner
 from utils.logger import get_logger
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, NamedTuple
 import os
-import shutil
+import time
 
 
-class ScanThread(QThread):
-    """Thread for directory scanning"""
-    progress = pyqtSignal(str, int, int)
+class SelectedNode(NamedTuple):
+    """Fields of a selected tree row, read from the tab's flat node arrays"""
+    path: str
+    name: str
+    size: int
+    is_dir: bool
+
+
+class DiskTreeItem(QTreeWidgetItem):
+    """Tree row that sorts the numeric columns by value, not by text"""
+    
+    def __lt__(self, other):
+        column = self.treeWidget().sortColumn()
+        if isinstance(other, DiskTreeItem):
+            if column == 1:
+                return self.size < other.size
+            if column == 2:
+                return self.item_count < other.item_count
+            if column == 3:
+                return self.percentage < other.percentage
+        return self.text(column) < other.text(column)
+
+
+# Tree item data role marking folders whose child rows have been created
+LOADED_ROLE = Qt.UserRole + 1
+
+# Minimum seconds between progress signals from worker threads (~50 Hz);
+# faster updates only queue repaints the dialog cannot show
+PROGRESS_INTERVAL = 0.02
+
+
+class _ScanSignals(QObject):
+    # Fired when the progress queue goes from empty to non-empty; the GUI
+    # drains everything queued so far with take_progress()
+    progress_ready = pyqtSignal()
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+
+
+class ScanRunnable(PoolRunnable):
+    """Runnable for directory scanning"""
+    SIGNALS = _ScanSignals
     
     def __init__(self, directory, min_size_mb=0, max_depth=None):
         super().__init__()
@@ -27,8 +70,11 @@ class ScanThread(QThread):
         self.max_depth = max_depth
         self.analyzer = DiskAnalyzer()
         self._is_cancelled = False
+        self._last_emit = 0.0
+        self._pending = deque(maxlen=1024)
+        self._pending_lock = QMutex()
     
-    def run(self):
+    def work(self):
         """Run the scan"""
         try:
             min_size_bytes = self.min_size_mb * 1024 * 1024
@@ -44,63 +90,188 @@ class ScanThread(QThread):
             self.error.emit(str(e))
     
     def progress_callback(self, message, current, total):
-        """Progress callback"""
-        if not self._is_cancelled:
-            self.progress.emit(message, current, total)
+        """
+        Progress callback (throttled to PROGRESS_INTERVAL)
+        
+        current/total count entries of the directory being listed, not the
+        whole scan, so no update is exempt; finished marks completion.
+        """
+        if self._is_cancelled:
+            return
+        now = time.monotonic()
+        if now - self._last_emit < PROGRESS_INTERVAL:
+            return
+        self._last_emit = now
+        
+        self._pending_lock.lock()
+        try:
+            was_empty = not self._pending
+            self._pending.append((message, current, total))
+        finally:
+            self._pending_lock.unlock()
+        
+        # The worker never waits on the GUI; one signal covers a whole batch
+        if was_empty:
+            self.progress_ready.emit()
+    
+    def take_progress(self):
+        """Drain queued (message, current, total) updates"""
+        self._pending_lock.lock()
+        try:
+            updates = list(self._pending)
+            self._pending.clear()
+        finally:
+            self._pending_lock.unlock()
+        return updates
     
     def cancel(self):
         """Cancel the scan"""
         self._is_cancelled = True
 
 
-class SecureDeleteThread(QThread):
-    """Thread for secure deletion"""
+class _DeleteSignals(QObject):
+    progress = pyqtSignal(str, int)  # message, completed_count
+    finished = pyqtSignal(int, int)  # deleted_count, total_count
+
+
+class DeleteRunnable(PoolRunnable):
+    """Runnable for deleting items in parallel"""
+    SIGNALS = _DeleteSignals
+    
+    # Independent trees are unlinked concurrently to overlap syscall latency
+    MAX_WORKERS = 4
+    
+    def __init__(self, items_to_delete):
+        super().__init__()
+        self.items_to_delete = items_to_delete
+        self.logger = get_logger()
+        self._is_cancelled = False
+    
+    def _delete_item(self, disk_item) -> bool:
+        """Delete one file or folder tree"""
+        if self._is_cancelled:
+            return False
+        try:
+            # A link to a folder is removed itself, not the folder behind it
+            if disk_item.is_dir and not os.path.islink(disk_item.path):
+                if not remove_tree(disk_item.path)[1]:
+                    self.logger.error(f"Could not fully delete {disk_item.path}")
+                    return False
+            else:
+                os.remove(disk_item.path)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.error(f"Error deleting {disk_item.path}: {e}")
+            return False
+        
+        self.logger.info(f"Deleted: {disk_item.path}")
+        return True
+    
+    def work(self):
+        """Run deletion"""
+        deleted_count = 0
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._delete_item, disk_item): disk_item
+                for disk_item in self.items_to_delete
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                if future.result():
+                    deleted_count += 1
+                self.progress.emit(f"Deleted: {futures[future].name}", completed)
+        
+        self.finished.emit(deleted_count, len(self.items_to_delete))
+    
+    def cancel(self):
+        """Cancel items that have not started yet"""
+        self._is_cancelled = True
+
+
+class _SecureDeleteSignals(QObject):
     progress = pyqtSignal(str, int)  # message, percentage
     finished = pyqtSignal(int, int)  # deleted_count, total_count
     error = pyqtSignal(str)
+
+
+class SecureDeleteRunnable(PoolRunnable):
+    """Runnable for secure deletion"""
+    SIGNALS = _SecureDeleteSignals
+    
+    # Selected files overwritten at once
+    MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
     
     def __init__(self, items_to_delete):
         super().__init__()
         self.items_to_delete = items_to_delete
         self._is_cancelled = False
         self.deleted_count = 0
+        self._last_emit = 0.0
+    
+    def _emit_progress(self, message, percentage, force=False):
+        """Emit progress, dropping updates closer than PROGRESS_INTERVAL"""
+        now = time.monotonic()
+        if not force and now - self._last_emit < PROGRESS_INTERVAL:
+            return
+        self._last_emit = now
+        self.progress.emit(message, percentage)
+    
+    def _delete_file(self, deleter, disk_item) -> bool:
+        """Securely delete one file unless the operation was cancelled"""
+        if self._is_cancelled:
+            return False
+        return deleter.secure_delete_file(disk_item.path, passes=3)
     
-    def run(self):
+    def work(self):
         """Run secure deletion"""
         try:
             deleter = SecureDelete()
             total_items = len(self.items_to_delete)
+            files = [item for item in self.items_to_delete if not item.is_dir]
+            folders = [item for item in self.items_to_delete if item.is_dir]
+            completed = 0
+            
+            # Independent files are overwritten concurrently to keep the
+            # device queue busy; progress moves as each file completes
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._delete_file, deleter, disk_item): disk_item
+                    for disk_item in files
+                }
+                for future in as_completed(futures):
+                    disk_item = futures[future]
+                    completed += 1
+                    try:
+                        if future.result():
+                            self.deleted_count += 1
+                    except Exception as e:
+                        self.error.emit(f"Error deleting {disk_item.path}: {str(e)}")
+                    
+                    if not self._is_cancelled:
+                        msg = f"File ({completed}/{total_items}): {disk_item.name}"
+                        self._emit_progress(msg, int((completed / total_items) * 100), force=completed == len(files))
             
-            for idx, disk_item in enumerate(self.items_to_delete):
+            # Folders already overwrite their files on a pool; run them one at a time
+            for disk_item in folders:
                 if self._is_cancelled:
                     break
                 
+                idx = completed
+                completed += 1
                 overall_progress = int((idx / total_items) * 100)
                 
                 try:
-                    if disk_item.is_dir:
-                        # Secure delete folder
-                        def folder_callback(current_file, file_idx, total_files):
-                            if self._is_cancelled:
-                                return
-                            file_name = os.path.basename(current_file)
-                            msg = f"Folder ({idx + 1}/{total_items}): {disk_item.name}\nFile {file_idx}/{total_files}: {file_name}"
-                            self.progress.emit(msg, overall_progress)
-                        
-                        self.progress.emit(f"Folder ({idx + 1}/{total_items}): {disk_item.name}\nCounting files...", overall_progress)
-                        
-                        if deleter.secure_delete_folder(disk_item.path, passes=3, callback=folder_callback):
-                            self.deleted_count += 1
-                    else:
-                        # Secure delete file
-                        def file_callback(current_pass, total_passes, status):
-                            if self._is_cancelled:
-                                return
-                            msg = f"File ({idx + 1}/{total_items}): {disk_item.name}\nPass {current_pass}/{total_passes}"
-                            self.progress.emit(msg, overall_progress)
-                        
-                        if deleter.secure_delete_file(disk_item.path, passes=3, callback=file_callback):
-                            self.deleted_count += 1
+                    def folder_callback(current_file, file_idx, total_files):
+                        if self._is_cancelled:
+                            return
+                        file_name = os.path.basename(current_file)
+                        msg = f"Folder ({idx + 1}/{total_items}): {disk_item.name}\nFile {file_idx}/{total_files}: {file_name}"
+                        self._emit_progress(msg, overall_progress, force=file_idx == total_files)
+                    
+                    self._emit_progress(f"Folder ({idx + 1}/{total_items}): {disk_item.name}\nCounting files...", overall_progress, force=True)
+                    
+                    if deleter.secure_delete_folder(disk_item.path, passes=3, callback=folder_callback):
+                        self.deleted_count += 1
                 except Exception as e:
                     self.error.emit(f"Error deleting {disk_item.path}: {str(e)}")
             
@@ -120,9 +291,34 @@ class DiskAnalyzerTab(QWidget):
         super().__init__()
         self.logger = get_logger()
         self.current_root = None
-        self.scan_thread = None
+        self.scan_runnable = None
+        # Smallest file shown in the tree, from the last scan's filter
+        self._min_size_bytes = 0
+        # False once a run is stopped or done, so late queued updates are dropped
+        self._scan_active = False
+        self._delete_active = False
+        self._secure_delete_active = False
+        self._reset_nodes()
         self.init_ui()
     
+    def _reset_nodes(self):
+        """
+        Clear the per-row node arrays
+        
+        Tree rows store an int index into these parallel arrays rather than
+        the DiskItem itself, so Qt holds a plain int per row and selection
+        sums index a packed size array.
+        """
+        self._node_paths: List[str] = []
+        self._node_names: List[str] = []
+        self._node_sizes = array('q')
+        self._node_is_dir = bytearray()
+        # Child lists kept for rows whose children are created on expand
+        self._node_children: List[List[DiskItem]] = []
+        # Running totals over the selected rows
+        self._selected_count = 0
+        self._selected_size = 0
+    
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
@@ -184,6 +380,7 @@ class DiskAnalyzerTab(QWidget):
         self.tree.setSelectionMode(QTreeWidget.ExtendedSelection)
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.tree.itemExpanded.connect(self._on_item_expanded)
         layout.addWidget(self.tree)
         
         # Bottom info and actions
@@ -212,7 +409,25 @@ class DiskAnalyzerTab(QWidget):
         self.setLayout(layout)
         
         # Connect selection changed
-        self.tree.itemSelectionChanged.connect(self.update_selection_info)
+        # Selection deltas keep running totals instead of re-summing the selection
+        self.tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+    
+    @staticmethod
+    def _set_enabled(button, enabled: bool):
+        """Change a button's state only when it differs (each change restyles it)"""
+        if button.isEnabled() != enabled:
+            button.setEnabled(enabled)
+    
+    def _set_busy(self, busy: bool, scanning: bool = False):
+        """Set all action buttons for a running (or finished) operation"""
+        idle = not busy
+        self._set_enabled(self.scan_btn, idle and bool(self.current_root))
+        self._set_enabled(self.refresh_btn, idle and bool(self.current_root))
+        self._set_enabled(self.select_btn, idle)
+        self._set_enabled(self.stop_btn, busy and scanning)
+        has_selection = idle and self._selected_count > 0
+        self._set_enabled(self.delete_btn, has_selection)
+        self._set_enabled(self.secure_delete_btn, has_selection)
     
     def select_directory(self):
         """Select directory to analyze"""
@@ -226,9 +441,10 @@ class DiskAnalyzerTab(QWidget):
         if directory:
             self.current_root = directory
             self.path_label.setText(f"Root: {directory}")
-            self.scan_btn.setEnabled(True)
-            self.refresh_btn.setEnabled(True)
+            self._set_enabled(self.scan_btn, True)
+            self._set_enabled(self.refresh_btn, True)
             self.tree.clear()
+            self._reset_nodes()
     
     def start_scan(self):
         """Start scanning"""
@@ -236,6 +452,7 @@ class DiskAnalyzerTab(QWidget):
             return
         
         min_size_mb = self.min_size_spin.value()
+        self._min_size_bytes = min_size_mb * 1024 * 1024
         max_depth = self.max_depth_spin.value() if self.max_depth_spin.value() > 0 else None
         
         # Create progress dialog
@@ -245,31 +462,39 @@ class DiskAnalyzerTab(QWidget):
         self.progress_dialog.canceled.connect(self.stop_scan)
         
         # Start scan thread
-        self.scan_thread = ScanThread(self.current_root, min_size_mb, max_depth)
-        self.scan_thread.progress.connect(self.update_progress)
-        self.scan_thread.finished.connect(self.scan_finished)
-        self.scan_thread.error.connect(self.scan_error)
-        self.scan_thread.start()
-        
-        self.scan_btn.setEnabled(False)
-        self.stop_btn.setEnabled(True)
-        self.select_btn.setEnabled(False)
+        self.scan_runnable = ScanRunnable(self.current_root, min_size_mb, max_depth)
+        self.scan_runnable.progress_ready.connect(self._drain_scan_progress)
+        self.scan_runnable.finished.connect(self.scan_finished)
+        self.scan_runnable.error.connect(self.scan_error)
+        self._scan_active = True
+        self.scan_runnable.start()
+        
+        self._set_busy(True, scanning=True)
     
     def stop_scan(self):
         """Stop scanning"""
-        if self.scan_thread:
-            self.scan_thread.cancel()
-            self.scan_thread.wait()
+        self._scan_active = False
+        if self.scan_runnable:
+            self.scan_runnable.cancel()
+            self.scan_runnable.wait()
         
         if hasattr(self, 'progress_dialog'):
             self.progress_dialog.close()
         
-        self.scan_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.select_btn.setEnabled(True)
+        self._set_busy(False)
+    
+    def _drain_scan_progress(self):
+        """Show the newest of the queued scan progress updates"""
+        if self.scan_runnable is None or not self._scan_active:
+            return
+        updates = self.scan_runnable.take_progress()
+        if updates:
+            self.update_progress(*updates[-1])
     
     def update_progress(self, message, current, total):
         """Update progress dialog"""
+        if not self._scan_active:
+            return
         if hasattr(self, 'progress_dialog'):
             self.progress_dialog.setLabelText(message)
             if total > 0:
@@ -277,47 +502,59 @@ class DiskAnalyzerTab(QWidget):
     
     def scan_finished(self, root_item: DiskItem):
         """Scan finished"""
+        self._scan_active = False
         if hasattr(self, 'progress_dialog'):
             self.progress_dialog.close()
         
-        self.tree.clear()
-        self.populate_tree(root_item, None)
-        self.tree.expandToDepth(0)
+        # Keep Qt from re-sorting and repainting after every insert
+        self.tree.setSortingEnabled(False)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.clear()
+            self._reset_nodes()
+            self.populate_tree(root_item, None)
+            self.tree.expandToDepth(0)
+        finally:
+            self.tree.setSortingEnabled(True)
+            self.tree.setUpdatesEnabled(True)
         
-        self.scan_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.select_btn.setEnabled(True)
+        self._set_busy(False)
         
         self.logger.info(f"Disk scan completed: {root_item.name}")
     
     def scan_error(self, error_msg):
         """Scan error"""
+        self._scan_active = False
         if hasattr(self, 'progress_dialog'):
             self.progress_dialog.close()
         
         QMessageBox.critical(self, "Scan Error", f"Error during scan:\n{error_msg}")
         
-        self.scan_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        self.select_btn.setEnabled(True)
+        self._set_busy(False)
     
-    def populate_tree(self, disk_item: DiskItem, parent_item):
-        """Populate tree with disk items"""
-        # Create tree item
-        item = QTreeWidgetItem()
-        item.setText(0, disk_item.name)
-        item.setText(1, Scanner.format_size(disk_item.size))
-        item.setText(2, str(disk_item.item_count))
-        item.setText(3, f"{disk_item.percentage:.1f}%")
-        item.setText(4, "Folder" if disk_item.is_dir else "File")
-        
-        # Set sort keys for numerical columns (for proper sorting)
-        item.setData(1, Qt.UserRole, disk_item.size)  # Size for sorting
-        item.setData(2, Qt.UserRole, disk_item.item_count)  # Items for sorting
-        item.setData(3, Qt.UserRole, disk_item.percentage)  # Percentage for sorting
-        
-        # Store disk_item for later use
-        item.setData(0, Qt.UserRole, disk_item)
+    def _create_tree_item(self, disk_item: DiskItem) -> QTreeWidgetItem:
+        """Create the tree row for a disk item"""
+        # All column texts in one constructor call
+        item = DiskTreeItem([
+            disk_item.name,
+            Scanner.format_size(disk_item.size),
+            str(disk_item.item_count),
+            f"{disk_item.percentage:.1f}%",
+            "Folder" if disk_item.is_dir else "File",
+        ])
+        
+        # Sort keys for numerical columns, read directly by DiskTreeItem.__lt__
+        item.size = disk_item.size
+        item.item_count = disk_item.item_count
+        item.percentage = disk_item.percentage
+        
+        # Store the node index for later use
+        item.setData(0, Qt.UserRole, len(self._node_paths))
+        self._node_paths.append(disk_item.path)
+        self._node_names.append(disk_item.name)
+        self._node_sizes.append(disk_item.size)
+        self._node_is_dir.append(disk_item.is_dir)
+        self._node_children.append(disk_item.children)
         
         # Color code by size percentage
         if disk_item.percentage > 50:
@@ -325,52 +562,94 @@ class DiskAnalyzerTab(QWidget):
         elif disk_item.percentage > 20:
             item.setForeground(1, Qt.yellow)
         
+        return item
+    
+    def _add_child_rows(self, children: List[DiskItem], item: QTreeWidgetItem):
+        """Add one level of rows under item; deeper levels load on expand"""
+        min_size = self._min_size_bytes
+        child_items = []
+        for child in children:
+            if child.size < min_size and not child.is_dir:
+                continue
+            child_item = self._create_tree_item(child)
+            if child.children:
+                # Placeholder so the expand arrow shows before children exist
+                child_item.addChild(QTreeWidgetItem(["Loading..."]))
+            child_items.append(child_item)
+        item.addChildren(child_items)
+        item.setData(0, LOADED_ROLE, True)
+    
+    def populate_tree(self, disk_item: DiskItem, parent_item):
+        """Populate tree with disk items (root and first level only)"""
+        item = self._create_tree_item(disk_item)
+        self._add_child_rows(disk_item.children, item)
+        
         # Add to tree
         if parent_item is None:
             self.tree.addTopLevelItem(item)
         else:
             parent_item.addChild(item)
+    
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Create a folder's child rows the first time it is expanded"""
+        if item.data(0, LOADED_ROLE):
+            return
+        
+        index = item.data(0, Qt.UserRole)
+        if index is None:
+            return
         
-        # Add children
-        for child in disk_item.children:
-            self.populate_tree(child, item)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            item.takeChildren()
+            self._add_child_rows(self._node_children[index], item)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+    
+    def _selected_nodes(self) -> List[SelectedNode]:
+        """Node fields for the selected rows (placeholder rows skipped)"""
+        rows = self.tree.selectionModel().selectedRows(0)
+        indices = [index for index in (row.data(Qt.UserRole) for row in rows) if index is not None]
+        paths, names, sizes, is_dir = (
+            self._node_paths, self._node_names, self._node_sizes, self._node_is_dir
+        )
+        return [
+            SelectedNode(paths[index], names[index], sizes[index], bool(is_dir[index]))
+            for index in indices
+        ]
+    
+    def _on_selection_changed(self, selected, deselected):
+        """Adjust the selection totals by the rows that changed"""
+        sizes = self._node_sizes
+        for delta, sign in ((selected, 1), (deselected, -1)):
+            for model_index in delta.indexes():
+                if model_index.column() != 0:
+                    continue
+                index = model_index.data(Qt.UserRole)
+                if index is not None:
+                    self._selected_count += sign
+                    self._selected_size += sign * sizes[index]
+        self.update_selection_info()
     
     def update_selection_info(self):
         """Update selection info"""
-        selected = self.tree.selectedItems()
-        
-        if not selected:
+        if not self._selected_count:
             self.info_label.setText("No items selected")
-            self.delete_btn.setEnabled(False)
-            self.secure_delete_btn.setEnabled(False)
+            self._set_enabled(self.delete_btn, False)
+            self._set_enabled(self.secure_delete_btn, False)
             return
         
-        total_size = 0
-        for item in selected:
-            disk_item = item.data(0, Qt.UserRole)
-            if disk_item:
-                total_size += disk_item.size
-        
         self.info_label.setText(
-            f"Selected: {len(selected)} items ({Scanner.format_size(total_size)})"
+            f"Selected: {self._selected_count} items ({Scanner.format_size(self._selected_size)})"
         )
-        self.delete_btn.setEnabled(True)
-        self.secure_delete_btn.setEnabled(True)
+        self._set_enabled(self.delete_btn, True)
+        self._set_enabled(self.secure_delete_btn, True)
     
     def delete_selected(self):
         """Delete selected items"""
-        selected = self.tree.selectedItems()
-        if not selected:
-            return
-        
         # Collect items data first (before tree modification)
-        items_to_delete = []
-        total_size = 0
-        for item in selected:
-            disk_item = item.data(0, Qt.UserRole)
-            if disk_item:
-                items_to_delete.append(disk_item)
-                total_size += disk_item.size
+        items_to_delete = self._selected_nodes()
+        total_size = sum(node.size for node in items_to_delete)
         
         if not items_to_delete:
             return
@@ -387,57 +666,69 @@ class DiskAnalyzerTab(QWidget):
         if reply != QMessageBox.Yes:
             return
         
+        # Items inside another selected folder go with that folder's rmtree
+        items_to_delete = self._drop_nested(items_to_delete)
+        
         # Create progress dialog
-        progress = QProgressDialog("Deleting items...", "Cancel", 0, len(items_to_delete), self)
-        progress.setWindowTitle("Deleting")
-        progress.setWindowModality(Qt.WindowModal)
+        self.delete_progress = QProgressDialog("Deleting items...", "Cancel", 0, len(items_to_delete), self)
+        self.delete_progress.setWindowTitle("Deleting")
+        self.delete_progress.setWindowModality(Qt.WindowModal)
+        self.delete_progress.canceled.connect(self.cancel_delete)
+        
+        # Start delete thread
+        self.delete_runnable = DeleteRunnable(items_to_delete)
+        self.delete_runnable.progress.connect(self.update_delete_progress)
+        self.delete_runnable.finished.connect(self.delete_finished)
+        self._delete_active = True
+        self.delete_runnable.start()
         
-        # Delete items
-        deleted_count = 0
-        for idx, disk_item in enumerate(items_to_delete):
-            if progress.wasCanceled():
-                break
-            
-            progress.setLabelText(f"Deleting: {disk_item.name}")
-            progress.setValue(idx)
-            QApplication.processEvents()
-            
-            try:
-                if os.path.exists(disk_item.path):
-                    if disk_item.is_dir:
-                        shutil.rmtree(disk_item.path)
-                    else:
-                        os.remove(disk_item.path)
-                    deleted_count += 1
-                    self.logger.info(f"Deleted: {disk_item.path}")
-            except Exception as e:
-                self.logger.error(f"Error deleting {disk_item.path}: {e}")
+        # Disable buttons during deletion
+        self._set_busy(True)
+    
+    @staticmethod
+    def _drop_nested(nodes: List[SelectedNode]) -> List[SelectedNode]:
+        """Remove nodes that sit inside another selected folder"""
+        folders = tuple(
+            os.path.join(node.path, '') for node in nodes if node.is_dir
+        )
+        return [node for node in nodes if not node.path.startswith(folders)]
+    
+    def update_delete_progress(self, message, completed):
+        """Update delete progress"""
+        if not self._delete_active:
+            return
+        if hasattr(self, 'delete_progress'):
+            self.delete_progress.setLabelText(message)
+            self.delete_progress.setValue(completed)
+    
+    def delete_finished(self, deleted_count, total_count):
+        """Delete finished"""
+        self._delete_active = False
+        if hasattr(self, 'delete_progress'):
+            self.delete_progress.close()
         
-        progress.setValue(len(items_to_delete))
-        progress.close()
+        # Re-enable buttons
+        self._set_busy(False)
         
         QMessageBox.information(
             self,
             "Deletion Complete",
-            f"Deleted {deleted_count} of {len(items_to_delete)} items."
+            f"Deleted {deleted_count} of {total_count} items."
         )
         
         self.refresh()
     
+    def cancel_delete(self):
+        """Cancel delete"""
+        self._delete_active = False
+        if hasattr(self, 'delete_runnable'):
+            self.delete_runnable.cancel()
+    
     def secure_delete_selected(self):
         """Securely delete selected items"""
-        selected = self.tree.selectedItems()
-        if not selected:
-            return
-        
         # Collect items data first
-        items_to_delete = []
-        total_size = 0
-        for item in selected:
-            disk_item = item.data(0, Qt.UserRole)
-            if disk_item:
-                items_to_delete.append(disk_item)
-                total_size += disk_item.size
+        items_to_delete = self._selected_nodes()
+        total_size = sum(node.size for node in items_to_delete)
         
         if not items_to_delete:
             return
@@ -448,7 +739,8 @@ class DiskAnalyzerTab(QWidget):
             "Confirm Secure Deletion",
             f"Securely delete {len(items_to_delete)} items ({Scanner.format_size(total_size)})?\n\n"
             "WARNING: This is PERMANENT and cannot be undone!\n"
-            "Files will be overwritten 3 times before deletion.\n\n"
+            "Files will be overwritten 3 times before deletion; on drives with\n"
+            "TRIM enabled (most SSDs) their data is deallocated and trimmed instead.\n\n"
             "Note: Large folders may take several minutes.",
             QMessageBox.Yes | QMessageBox.No
         )
@@ -465,32 +757,32 @@ class DiskAnalyzerTab(QWidget):
         self.secure_delete_progress.canceled.connect(self.cancel_secure_delete)
         
         # Start secure delete thread
-        self.secure_delete_thread = SecureDeleteThread(items_to_delete)
-        self.secure_delete_thread.progress.connect(self.update_secure_delete_progress)
-        self.secure_delete_thread.finished.connect(self.secure_delete_finished)
-        self.secure_delete_thread.error.connect(self.secure_delete_error)
-        self.secure_delete_thread.start()
+        self.secure_delete_runnable = SecureDeleteRunnable(items_to_delete)
+        self.secure_delete_runnable.progress.connect(self.update_secure_delete_progress)
+        self.secure_delete_runnable.finished.connect(self.secure_delete_finished)
+        self.secure_delete_runnable.error.connect(self.secure_delete_error)
+        self._secure_delete_active = True
+        self.secure_delete_runnable.start()
         
         # Disable buttons during deletion
-        self.delete_btn.setEnabled(False)
-        self.secure_delete_btn.setEnabled(False)
-        self.scan_btn.setEnabled(False)
+        self._set_busy(True)
     
     def update_secure_delete_progress(self, message, percentage):
         """Update secure delete progress"""
+        if not self._secure_delete_active:
+            return
         if hasattr(self, 'secure_delete_progress'):
             self.secure_delete_progress.setLabelText(message)
             self.secure_delete_progress.setValue(percentage)
     
     def secure_delete_finished(self, deleted_count, total_count):
         """Secure delete finished"""
+        self._secure_delete_active = False
         if hasattr(self, 'secure_delete_progress'):
             self.secure_delete_progress.close()
         
         # Re-enable buttons
-        self.delete_btn.setEnabled(True)
-        self.secure_delete_btn.setEnabled(True)
-        self.scan_btn.setEnabled(True)
+        self._set_busy(False)
         
         QMessageBox.information(
             self,
@@ -506,8 +798,9 @@ class DiskAnalyzerTab(QWidget):
     
     def cancel_secure_delete(self):
         """Cancel secure delete"""
-        if hasattr(self, 'secure_delete_thread'):
-            self.secure_delete_thread.cancel()
+        self._secure_delete_active = False
+        if hasattr(self, 'secure_delete_runnable'):
+            self.secure_delete_runnable.cancel()
     
     def refresh(self):
         """Refresh the scan"""
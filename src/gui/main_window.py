@@ -3,7 +3,7 @@ Main application window
 """
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QStatusBar, 
                              QMenuBar, QAction, QMessageBox, QWidget, QVBoxLayout)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QMetaObject, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon
 import os
 
@@ -13,19 +13,30 @@ from gui.tools_tab import ToolsTab
 from gui.disk_analyzer_tab import DiskAnalyzerTab
 from gui.optimizer_tab import OptimizerTab
 from gui.settings_tab import SettingsTab
+from gui.workers import ResourceWorker
+from core.optimizer import SystemOptimizer
 from utils.config import get_config
 from utils.logger import get_logger
 from utils.admin import check_admin_and_warn
 
+# Status bar text for a ResourceStats sample
+_stats_fmt = "CPU: {:.1f}% | RAM: {:.1f}% | Disk: {:.1f}%".format
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # ResourceStats from the shared resource poller
+    resources_updated = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         self.config = get_config()
         self.logger = get_logger()
+        # Shared by the tabs and the resource poller
+        self.optimizer = SystemOptimizer()
+        # (cpu, memory, disk) percentages last shown in the status bar
+        self._last_stats = None
         
         self.init_ui()
         self.check_admin_status()
@@ -52,21 +63,19 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # Create tabs
+        # Create tabs. Only the dashboard is built up front; the others start
+        # as placeholders and are built the first time they are selected.
         self.dashboard_tab = DashboardTab(self)
-        self.cleaner_tab = CleanerTab(self)
-        self.tools_tab = ToolsTab(self)
-        self.disk_analyzer_tab = DiskAnalyzerTab()
-        self.optimizer_tab = OptimizerTab(self)
-        self.settings_tab = SettingsTab(self)
-        
-        # Add tabs
         self.tabs.addTab(self.dashboard_tab, "📊 Dashboard")
-        self.tabs.addTab(self.cleaner_tab, "🧹 Cleaner")
-        self.tabs.addTab(self.tools_tab, "🔧 Tools")
-        self.tabs.addTab(self.disk_analyzer_tab, "💾 Disk Analyzer")
-        self.tabs.addTab(self.optimizer_tab, "🚀 Optimizer")
-        self.tabs.addTab(self.settings_tab, "⚙️ Settings")
+        
+        self._tab_factories = {}  # tab index -> (attribute name, factory)
+        self._tab_indexes = {}    # attribute name -> tab index
+        self._add_lazy_tab('cleaner_tab', "🧹 Cleaner", lambda: CleanerTab(self))
+        self._add_lazy_tab('tools_tab', "🔧 Tools", lambda: ToolsTab(self))
+        self._add_lazy_tab('disk_analyzer_tab', "💾 Disk Analyzer", DiskAnalyzerTab)
+        self._add_lazy_tab('optimizer_tab', "🚀 Optimizer", self._create_optimizer_tab)
+        self._add_lazy_tab('settings_tab', "⚙️ Settings", lambda: SettingsTab(self))
+        self.tabs.currentChanged.connect(self._materialize_tab)
         
         # Create menu bar
         self.create_menu_bar()
@@ -76,13 +85,62 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
-        # Update status bar periodically
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self.update_status_bar)
-        self.status_timer.start(2000)  # Update every 2 seconds
+        # One poller on a worker thread; its results fan out through
+        # resources_updated to the status bar and the tabs, which only format them
+        self._res_thread = QThread(self)
+        self._res_worker = ResourceWorker(self.optimizer)
+        self._res_worker.moveToThread(self._res_thread)
+        self._res_thread.started.connect(self._res_worker.start_timer)
+        self._res_worker.stats_ready.connect(self.resources_updated, Qt.QueuedConnection)
+        self.resources_updated.connect(self.update_status_bar)
+        self.resources_updated.connect(self.dashboard_tab.update_stats)
+        self._res_thread.start()
         
         self.logger.info("Main window initialized")
     
+    def _add_lazy_tab(self, attr: str, label: str, factory):
+        """Add a placeholder tab whose real widget is built on first selection"""
+        index = self.tabs.addTab(QWidget(), label)
+        self._tab_factories[index] = (attr, factory)
+        self._tab_indexes[attr] = index
+        setattr(self, attr, None)
+    
+    def _create_optimizer_tab(self):
+        """Build the optimizer tab and feed it the shared resource samples"""
+        tab = OptimizerTab(self)
+        self.resources_updated.connect(tab.update_resources)
+        return tab
+    
+    def _materialize_tab(self, index: int):
+        """Swap a placeholder tab for its real widget"""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        
+        attr, factory = entry
+        widget = factory()
+        setattr(self, attr, widget)
+        
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        # Removing the current tab would select (and build) a neighbour
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def show_tab(self, attr: str) -> QWidget:
+        """Select a tab by its attribute name, building it if needed"""
+        index = self._tab_indexes.get(attr)
+        if index is None:
+            widget = getattr(self, attr)
+            self.tabs.setCurrentWidget(widget)
+            return widget
+        self.tabs.setCurrentIndex(index)
+        return getattr(self, attr)
+    
     def create_menu_bar(self):
         """Create menu bar"""
         menubar = self.menuBar()
@@ -121,28 +179,23 @@ class MainWindow(QMainWindow):
             )
             self.status_bar.showMessage("⚠️ Non in esecuzione come amministratore")
     
-    def update_status_bar(self):
+    def update_status_bar(self, stats):
         """Update status bar with system info"""
-        from core.optimizer import SystemOptimizer
-        
-        try:
-            optimizer = SystemOptimizer()
-            stats = optimizer.get_system_resources()
-            
-            status_text = (
-                f"CPU: {stats.cpu_percent:.1f}% | "
-                f"RAM: {stats.memory_percent:.1f}% | "
-                f"Disk: {stats.disk_percent:.1f}%"
-            )
-            self.status_bar.showMessage(status_text)
-        except Exception as e:
-            self.logger.error(f"Error updating status bar: {e}")
+        shown = (
+            round(stats.cpu_percent, 1),
+            round(stats.memory_percent, 1),
+            round(stats.disk_percent, 1),
+        )
+        if shown == self._last_stats:
+            # Same text as on screen; skip the repaint
+            return
+        self._last_stats = shown
+        self.status_bar.showMessage(_stats_fmt(*shown))
 
     
     def quick_analyze(self):
         """Quick system analyze"""
-        self.tabs.setCurrentWidget(self.cleaner_tab)
-        self.cleaner_tab.analyze()
+        self.show_tab('cleaner_tab').analyze()
     
     def show_about(self):
         """Show about dialog"""
@@ -166,4 +219,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         self.logger.info("Application closing")
+        QMetaObject.invokeMethod(self._res_worker, "stop_timer", Qt.BlockingQueuedConnection)
+        self._res_thread.quit()
+        self._res_thread.wait()
+        if self.tools_tab is not None:
+            self.tools_tab.shutdown()
         event.accept()
@@ -2,28 +2,48 @@
 Optimizer tab - Startup programs and resource monitoring
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QGroupBox, QTableWidget, QTableWidgetItem,
-                             QMessageBox, QHeaderView)
-from PyQt5.QtCore import Qt, QTimer
+                             QPushButton, QGroupBox, QTableWidget,
+                             QMessageBox, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
 from core.optimizer import SystemOptimizer
+from gui.dialogs import ask_yes_no, show_information
+from gui.table_utils import fill_table, setup_table_view
+from gui.workers import PoolRunnable
 from utils.logger import get_logger
 
 
 
+class _DisableSignals(QObject):
+    finished = pyqtSignal(list)
+
+
+class DisableStartupRunnable(PoolRunnable):
+    """Background runnable disabling startup programs in one batch"""
+    SIGNALS = _DisableSignals
+    
+    def __init__(self, optimizer, items):
+        super().__init__()
+        self.optimizer = optimizer
+        self.items = items
+    
+    def work(self):
+        """Disable the items; finished carries a success flag per item"""
+        self.finished.emit(self.optimizer.disable_startup_programs(self.items))
+
+
 class OptimizerTab(QWidget):
     """System optimizer tab"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger()
-        self.optimizer = SystemOptimizer()
+        # Share the main window's optimizer when there is one
+        self.optimizer = getattr(parent, 'optimizer', None) or SystemOptimizer()
         self.startup_items = []
+        self.disable_runnable = None
+        # Newest resource sample, shown when the tab becomes visible
+        self._pending_stats = None
         self.init_ui()
-        
-        # Auto-refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.update_resources)
-        self.refresh_timer.start(2000)  # Update every 2 seconds
     
     def init_ui(self):
         """Initialize UI"""
@@ -68,17 +88,20 @@ class OptimizerTab(QWidget):
         # Startup table
         self.startup_table = QTableWidget()
         self.startup_table.setColumnCount(3)
+        setup_table_view(self.startup_table)
         self.startup_table.setHorizontalHeaderLabels(["Name", "Command", "Location"])
         self.startup_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.startup_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.startup_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         startup_layout.addWidget(self.startup_table)
         
         # Action buttons
         action_layout = QHBoxLayout()
         
-        disable_btn = QPushButton("🚫 Disable Selected")
-        disable_btn.setObjectName("dangerButton")
-        disable_btn.clicked.connect(self.disable_selected)
-        action_layout.addWidget(disable_btn)
+        self.disable_btn = QPushButton("🚫 Disable Selected")
+        self.disable_btn.setObjectName("dangerButton")
+        self.disable_btn.clicked.connect(self.disable_selected)
+        action_layout.addWidget(self.disable_btn)
         
         action_layout.addStretch()
         startup_layout.addLayout(action_layout)
@@ -87,40 +110,43 @@ class OptimizerTab(QWidget):
         
         # Initial load
         self.refresh_startup_programs()
-        self.update_resources()
     
-    def update_resources(self):
-        """Update resource statistics"""
-        try:
-            stats = self.optimizer.get_system_resources()
-            
-            self.cpu_label.setText(f"🖥️ CPU: {stats.cpu_percent:.1f}%")
-            self.memory_label.setText(
-                f"💾 Memory: {stats.memory_percent:.1f}% "
-                f"({stats.memory_used_mb} / {stats.memory_total_mb} MB)"
-            )
-            self.disk_label.setText(
-                f"💿 Disk: {stats.disk_percent:.1f}% "
-                f"({stats.disk_used_gb:.1f} / {stats.disk_total_gb:.1f} GB)"
-            )
-        except Exception as e:
-            self.logger.error(f"Error updating resources: {e}")
+    def showEvent(self, event):
+        """Show the sample that arrived while the tab was hidden"""
+        super().showEvent(event)
+        if self._pending_stats is not None:
+            self.update_resources(self._pending_stats)
+    
+    def update_resources(self, stats):
+        """Show resource statistics polled by the main window's worker"""
+        if not self.isVisible():
+            # Labels are off screen; keep the sample for showEvent
+            self._pending_stats = stats
+            return
+        self._pending_stats = None
+        self.cpu_label.setText(f"🖥️ CPU: {stats.cpu_percent:.1f}%")
+        self.memory_label.setText(
+            f"💾 Memory: {stats.memory_percent:.1f}% "
+            f"({stats.memory_used_mb} / {stats.memory_total_mb} MB)"
+        )
+        self.disk_label.setText(
+            f"💿 Disk: {stats.disk_percent:.1f}% "
+            f"({stats.disk_used_gb:.1f} / {stats.disk_total_gb:.1f} GB)"
+        )
     
     def refresh_startup_programs(self):
         """Refresh startup programs list"""
         self.startup_items = self.optimizer.get_startup_programs()
-        self.startup_table.setRowCount(len(self.startup_items))
-        
-        for row, item in enumerate(self.startup_items):
-            self.startup_table.setItem(row, 0, QTableWidgetItem(item.name))
-            self.startup_table.setItem(row, 1, QTableWidgetItem(item.command))
-            self.startup_table.setItem(row, 2, QTableWidgetItem(item.location))
+        fill_table(
+            self.startup_table, self.startup_items,
+            lambda item: (item.name, item.command, item.location)
+        )
         
         self.logger.info(f"Found {len(self.startup_items)} startup programs")
     
     def disable_selected(self):
         """Disable selected startup programs"""
-        selected_rows = set(item.row() for item in self.startup_table.selectedItems())
+        selected_rows = [index.row() for index in self.startup_table.selectionModel().selectedRows()]
         
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select programs to disable")
@@ -128,26 +154,34 @@ class OptimizerTab(QWidget):
         
         selected_items = [self.startup_items[row] for row in selected_rows]
         
-        reply = QMessageBox.question(
+        ask_yes_no(
             self,
             "Confirm Disable",
             f"Are you sure you want to disable {len(selected_items)} startup program(s)?",
-            QMessageBox.Yes | QMessageBox.No
+            lambda: self._disable_items(selected_items)
+        )
+    
+    def _disable_items(self, items):
+        """Disable confirmed startup programs in the background"""
+        self.disable_btn.setEnabled(False)
+        self.disable_runnable = DisableStartupRunnable(self.optimizer, items)
+        self.disable_runnable.finished.connect(self.on_disable_finished)
+        self.disable_runnable.start()
+    
+    def on_disable_finished(self, results):
+        """Report disable results and reload the list"""
+        self.disable_btn.setEnabled(True)
+        items = self.disable_runnable.items
+        for item, success in zip(items, results):
+            if success:
+                self.logger.info(f"Disabled startup program: {item.name}")
+            else:
+                self.logger.error(f"Failed to disable: {item.name}")
+        
+        show_information(
+            self,
+            "Operation Complete",
+            f"Successfully disabled {sum(results)} of {len(items)} programs"
         )
         
-        if reply == QMessageBox.Yes:
-            success_count = 0
-            for item in selected_items:
-                if self.optimizer.disable_startup_program(item):
-                    success_count += 1
-                    self.logger.info(f"Disabled startup program: {item.name}")
-                else:
-                    self.logger.error(f"Failed to disable: {item.name}")
-            
-            QMessageBox.information(
-                self,
-                "Operation Complete",
-                f"Successfully disabled {success_count} of {len(selected_items)} programs"
-            )
-            
-            self.refresh_startup_programs()
+        self.refresh_startup_programs()
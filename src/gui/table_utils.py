@@ -0,0 +1,128 @@
+"""
+Helpers for result tables
+"""
+from typing import Callable, Iterable, Sequence
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QTableWidget, QTableWidgetItem
+
+# Result tables are read-only: no editor is ever set up for their cells
+ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+# Height of every result table row (px)
+ROW_HEIGHT = 22
+
+
+def setup_table_view(table: QTableView):
+    """
+    Give a result table fixed-height rows and per-pixel scrolling
+
+    With every row the same height, layout and scrolling never ask the
+    delegate to size individual rows, whatever the row count.
+    """
+    header = table.verticalHeader()
+    header.setDefaultSectionSize(ROW_HEIGHT)
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    table.setWordWrap(False)
+    table.setShowGrid(False)
+
+
+def fill_table(table: QTableWidget, rows: Sequence, columns: Callable[[object], Iterable[str]]):
+    """
+    Replace the contents of a table in one batch
+
+    Sorting, signals and repaints are suspended while the cells are set, so
+    the table is laid out and painted once instead of once per cell.
+
+    Args:
+        table: Table to fill
+        rows: Objects to show, one per row
+        columns: Returns the cell texts of a row object
+    """
+    # Format everything up front, before the table is frozen
+    texts = [tuple(columns(obj)) for obj in rows]
+
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.blockSignals(True)
+    table.setUpdatesEnabled(False)
+    try:
+        table.clearContents()
+        table.setRowCount(len(texts))
+        make_item = QTableWidgetItem
+        set_item = table.setItem
+        flags = ITEM_FLAGS
+        for row, cells in enumerate(texts):
+            for column, text in enumerate(cells):
+                # Empty cells are left without an item
+                if text:
+                    item = make_item(text)
+                    item.setFlags(flags)
+                    set_item(row, column, item)
+    finally:
+        table.setUpdatesEnabled(True)
+        table.blockSignals(False)
+        table.setSortingEnabled(sorting)
+
+
+class RowTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of row objects
+
+    Subclasses set HEADERS and implement format_row(). Cell texts are built
+    on demand, only for rows the view asks about, and cached per row since
+    data() is called again on every repaint and scroll.
+    """
+    HEADERS = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._texts = []
+
+    @property
+    def rows(self) -> list:
+        """Row objects, in display order"""
+        return self._rows
+
+    def set_rows(self, rows: Sequence):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._texts = [None] * len(self._rows)
+        self.endResetModel()
+
+    def append_rows(self, rows: Sequence):
+        """Add rows at the end"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._texts.extend([None] * len(rows))
+        self.endInsertRows()
+
+    def format_row(self, obj) -> tuple:
+        """Return the cell texts of a row object"""
+        raise NotImplementedError
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        texts = self._texts[row]
+        if texts is None:
+            texts = self._texts[row] = self.format_row(self._rows[row])
+        return texts[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
@@ -2,63 +2,145 @@
 Tools tab - Duplicate finder and software manager
 """
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QGroupBox, QTableWidget, QTableWidgetItem,
-                             QFileDialog, QMessageBox, QHeaderView, QTabWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                             QPushButton, QGroupBox, QTableView,
+                             QFileDialog, QMessageBox, QHeaderView, QTabWidget,
+                             QAbstractItemView)
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
 from core.duplicate_finder import DuplicateFinder
 from core.software_manager import SoftwareManager
+from gui.dialogs import ask_yes_no, show_information
+from gui.table_utils import RowTableModel, setup_table_view
+from gui.workers import PoolRunnable
 from utils.scanner import Scanner
 from utils.logger import get_logger
 import os
+import time
 
 
 
-class DuplicateScanThread(QThread):
-    """Thread for duplicate file scanning"""
-    progress = pyqtSignal(str, int)
-    finished = pyqtSignal(dict)
+class DuplicateModel(RowTableModel):
+    """Duplicate groups: first file's name and size, copies, wasted space"""
+    HEADERS = ("File Name", "Size", "Count", "Wasted Space")
     
-    def __init__(self, directories):
-        super().__init__()
-        self.directories = directories
+    def format_row(self, group):
+        first = group.files[0]
+        return (
+            os.path.basename(first.path),
+            Scanner.format_size(first.size),
+            str(len(group.files)),
+            Scanner.format_size(group.get_wasted_space()),
+        )
+
+
+class SoftwareModel(RowTableModel):
+    """Installed programs"""
+    HEADERS = ("Name", "Version", "Size", "Publisher")
     
-    def run(self):
-        """Run duplicate scan"""
-        finder = DuplicateFinder(min_size=1024)  # 1KB minimum
-        
-        def callback(filepath, count):
-            self.progress.emit(filepath, count)
-        
-        duplicates = finder.find_duplicates(self.directories, callback=callback)
-        stats = finder.get_statistics()
-        
-        self.finished.emit({
-            'duplicates': duplicates,
-            'stats': stats
-        })
+    def format_row(self, software):
+        return (software.name, software.version, software.get_size_formatted(), software.publisher)
 
 
-class SoftwareScanThread(QThread):
-    """Thread for software scanning"""
+class _SoftwareScanSignals(QObject):
     finished = pyqtSignal(list)
+
+
+class SoftwareScanRunnable(PoolRunnable):
+    """Scans installed software on the global thread pool"""
+    SIGNALS = _SoftwareScanSignals
     
-    def run(self):
+    def work(self):
         """Run software scan"""
-        manager = SoftwareManager(show_system_software=False)
-        software_list = manager.get_installed_software()
+        try:
+            software_list = SoftwareManager(show_system_software=False).get_installed_software()
+        except Exception as e:
+            get_logger().error(f"Software scan failed: {e}")
+            software_list = []
+        # Always sent: the tab starts no new scan until it arrives
         self.finished.emit(software_list)
 
 
+class BackgroundScanner(QObject):
+    """
+    Long-lived worker for the tools tab's duplicate scans
+    
+    Lives on one QThread for the life of the tab; scans are requested
+    through a queued signal. cancel() may be called from any thread.
+    """
+    progress = pyqtSignal(str, int)
+    # Newly confirmed DuplicateGroups, emitted while the scan runs
+    duplicates_batch = pyqtSignal(list)
+    duplicates_ready = pyqtSignal(dict)
+    
+    def __init__(self):
+        super().__init__()
+        self._finder = None
+        self._cancelled = False
+    
+    def cancel(self):
+        """Stop the running scan, and any requested after it"""
+        self._cancelled = True
+        finder = self._finder
+        if finder is not None:
+            finder.cancel()
+    
+    @pyqtSlot(list)
+    def scan_duplicates(self, directories):
+        """Run duplicate scan"""
+        finder = self._finder = DuplicateFinder(min_size=1024)  # 1KB minimum
+        # Checked after publishing the finder, so a concurrent cancel() is never missed
+        if self._cancelled:
+            return
+        try:
+            finder.find_duplicates(
+                directories, callback=self.progress.emit, group_callback=self.duplicates_batch.emit
+            )
+        except Exception as e:
+            get_logger().error(f"Duplicate scan failed: {e}")
+        finally:
+            self._finder = None
+        if self._cancelled:
+            return
+        # Sent unless cancelled: the tab re-enables scanning when it arrives
+        self.duplicates_ready.emit(finder.get_statistics())
+
+
 class ToolsTab(QWidget):
     """Tools tab with duplicate finder and software manager"""
     
+    # Seconds a software scan result is reused without scanning again
+    SOFTWARE_TTL = 30.0
+    
+    # Queued into the background scanner's thread
+    duplicates_requested = pyqtSignal(list)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger()
         self.duplicates = {}
         self.software_list = []
+        # (time.monotonic() of the scan, result) of the last software scan
+        self._sw_cache = (float('-inf'), [])
+        self.software_runnable = None
+        
+        self._bg_thread = QThread(self)
+        self._scanner = BackgroundScanner()
+        self._scanner.moveToThread(self._bg_thread)
+        self.duplicates_requested.connect(self._scanner.scan_duplicates)
+        self._scanner.duplicates_batch.connect(self._append_groups)
+        self._scanner.duplicates_ready.connect(self.on_duplicate_scan_finished)
+        self._bg_thread.start()
+        
         self.init_ui()
     
+    def shutdown(self):
+        """Cancel any duplicate scan and stop the background work"""
+        self._scanner.cancel()
+        self._bg_thread.quit()
+        self._bg_thread.wait()
+        # Registry reads only, so this is short
+        if self.software_runnable is not None:
+            self.software_runnable.wait()
+    
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
@@ -79,7 +161,13 @@ class ToolsTab(QWidget):
         
         # Software Manager Tab
         soft_widget = self.create_software_manager_tab()
-        self.tool_tabs.addTab(soft_widget, "🗑️ Software Manager")
+        self._software_tab_index = self.tool_tabs.addTab(soft_widget, "🗑️ Software Manager")
+        self.tool_tabs.currentChanged.connect(self._on_tool_tab_changed)
+    
+    def _on_tool_tab_changed(self, index):
+        """Refresh the software list on entering its tab (reused within SOFTWARE_TTL)"""
+        if index == self._software_tab_index:
+            self.refresh_software_list()
     
     def create_duplicate_finder_tab(self):
         """Create duplicate finder interface"""
@@ -94,17 +182,20 @@ class ToolsTab(QWidget):
         select_dir_btn.clicked.connect(self.select_directory)
         controls_layout.addWidget(select_dir_btn)
         
-        scan_btn = QPushButton("🔍 Scan for Duplicates")
-        scan_btn.clicked.connect(self.scan_duplicates)
-        controls_layout.addWidget(scan_btn)
+        self.scan_btn = QPushButton("🔍 Scan for Duplicates")
+        self.scan_btn.clicked.connect(self.scan_duplicates)
+        controls_layout.addWidget(self.scan_btn)
         
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
         
         # Results table
-        self.dup_table = QTableWidget()
-        self.dup_table.setColumnCount(4)
-        self.dup_table.setHorizontalHeaderLabels(["File Name", "Size", "Count", "Wasted Space"])
+        self.dup_model = DuplicateModel(self)
+        self.dup_table = QTableView()
+        self.dup_table.setModel(self.dup_model)
+        setup_table_view(self.dup_table)
+        self.dup_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.dup_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.dup_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         layout.addWidget(self.dup_table)
         
@@ -131,16 +222,19 @@ class ToolsTab(QWidget):
         controls_layout = QHBoxLayout()
         
         refresh_btn = QPushButton("🔄 Refresh List")
-        refresh_btn.clicked.connect(self.refresh_software_list)
+        refresh_btn.clicked.connect(lambda: self.refresh_software_list(force=True))
         controls_layout.addWidget(refresh_btn)
         
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
         
         # Software table
-        self.software_table = QTableWidget()
-        self.software_table.setColumnCount(4)
-        self.software_table.setHorizontalHeaderLabels(["Name", "Version", "Size", "Publisher"])
+        self.software_model = SoftwareModel(self)
+        self.software_table = QTableView()
+        self.software_table.setModel(self.software_model)
+        setup_table_view(self.software_table)
+        self.software_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.software_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.software_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         layout.addWidget(self.software_table)
         
@@ -172,37 +266,23 @@ class ToolsTab(QWidget):
         if not hasattr(self, 'scan_directory'):
             self.scan_directory = "C:\\Users"
         
-        self.dup_table.setRowCount(0)
+        # One scan at a time, so every batch that arrives belongs to this one
+        self.scan_btn.setEnabled(False)
+        self.duplicates = {}
+        self.dup_model.set_rows([])
         self.logger.info(f"Scanning for duplicates in {self.scan_directory}")
         
-        self.scan_thread = DuplicateScanThread([self.scan_directory])
-        self.scan_thread.finished.connect(self.on_duplicate_scan_finished)
-        self.scan_thread.start()
+        self.duplicates_requested.emit([self.scan_directory])
+    
+    def _append_groups(self, groups):
+        """Show duplicate groups as soon as the scan confirms them"""
+        self.duplicates.update((group.hash, group) for group in groups)
+        self.dup_model.append_rows(groups)
     
-    def on_duplicate_scan_finished(self, result):
+    def on_duplicate_scan_finished(self, stats):
         """Handle duplicate scan completion"""
-        self.duplicates = result['duplicates']
-        stats = result['stats']
-        
-        self.dup_table.setRowCount(len(self.duplicates))
-        
-        for row, (file_hash, group) in enumerate(self.duplicates.items()):
-            # File name (first file in group)
-            filename = os.path.basename(group.files[0].path)
-            self.dup_table.setItem(row, 0, QTableWidgetItem(filename))
-            
-            # Size
-            size_str = Scanner.format_size(group.files[0].size)
-            self.dup_table.setItem(row, 1, QTableWidgetItem(size_str))
-            
-            # Count
-            self.dup_table.setItem(row, 2, QTableWidgetItem(str(len(group.files))))
-            
-            # Wasted space
-            wasted = Scanner.format_size(group.get_wasted_space())
-            self.dup_table.setItem(row, 3, QTableWidgetItem(wasted))
-        
-        QMessageBox.information(
+        self.scan_btn.setEnabled(True)
+        show_information(
             self,
             "Scan Complete",
             f"Found {stats['total_groups']} groups of duplicates\n"
@@ -214,31 +294,47 @@ class ToolsTab(QWidget):
         """Delete selected duplicate files"""
         QMessageBox.information(self, "Feature", "Duplicate deletion will be implemented")
     
-    def refresh_software_list(self):
-        """Refresh installed software list"""
-        self.software_table.setRowCount(0)
-        self.logger.info("Scanning installed software")
+    def refresh_software_list(self, force=False):
+        """
+        Refresh installed software list
+        
+        Args:
+            force: Scan again even if the last result is still fresh
+        """
+        scanned_at, software_list = self._sw_cache
+        if not force and time.monotonic() - scanned_at < self.SOFTWARE_TTL:
+            # Already on screen unless the table was cleared since
+            if software_list is not self.software_list:
+                self._show_software(software_list)
+            return
         
-        self.software_thread = SoftwareScanThread()
-        self.software_thread.finished.connect(self.on_software_scan_finished)
-        self.software_thread.start()
+        if self.software_runnable is not None:
+            # A scan is already running; its result will be shown
+            return
+        
+        self.software_model.set_rows([])
+        self.logger.info("Scanning installed software")
+        # On the pool, so it never waits behind a duplicate scan
+        self.software_runnable = SoftwareScanRunnable()
+        self.software_runnable.finished.connect(self.on_software_scan_finished)
+        self.software_runnable.start()
     
     def on_software_scan_finished(self, software_list):
         """Handle software scan completion"""
-        self.software_list = software_list
-        self.software_table.setRowCount(len(software_list))
-        
-        for row, software in enumerate(software_list):
-            self.software_table.setItem(row, 0, QTableWidgetItem(software.name))
-            self.software_table.setItem(row, 1, QTableWidgetItem(software.version))
-            self.software_table.setItem(row, 2, QTableWidgetItem(software.get_size_formatted()))
-            self.software_table.setItem(row, 3, QTableWidgetItem(software.publisher))
+        self.software_runnable = None
+        self._sw_cache = (time.monotonic(), software_list)
+        self._show_software(software_list)
         
         self.logger.info(f"Found {len(software_list)} installed programs")
     
+    def _show_software(self, software_list):
+        """Show a software list in the table"""
+        self.software_list = software_list
+        self.software_model.set_rows(software_list)
+    
     def uninstall_selected(self):
         """Uninstall selected software"""
-        selected_rows = set(item.row() for item in self.software_table.selectedItems())
+        selected_rows = [index.row() for index in self.software_table.selectionModel().selectedRows()]
         
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select software to uninstall")
@@ -246,21 +342,22 @@ class ToolsTab(QWidget):
         
         selected_software = [self.software_list[row] for row in selected_rows]
         
-        reply = QMessageBox.question(
+        ask_yes_no(
             self,
             "Confirm Uninstall",
             f"Are you sure you want to uninstall {len(selected_software)} program(s)?",
-            QMessageBox.Yes | QMessageBox.No
+            lambda: self._uninstall(selected_software)
         )
-        
-        if reply == QMessageBox.Yes:
-            manager = SoftwareManager()
-            for software in selected_software:
-                success = manager.uninstall_software(software)
-                if success:
-                    self.logger.info(f"Uninstalling: {software.name}")
-                else:
-                    self.logger.error(f"Failed to uninstall: {software.name}")
-            
-            QMessageBox.information(self, "Uninstall", "Uninstall commands executed")
-            self.refresh_software_list()
+    
+    def _uninstall(self, selected_software):
+        """Launch the uninstallers of confirmed programs"""
+        manager = SoftwareManager()
+        for software in selected_software:
+            success = manager.uninstall_software(software)
+            if success:
+                self.logger.info(f"Uninstalling: {software.name}")
+            else:
+                self.logger.error(f"Failed to uninstall: {software.name}")
+        
+        show_information(self, "Uninstall", "Uninstall commands executed")
+        self.refresh_software_list(force=True)
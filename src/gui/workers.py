@@ -0,0 +1,99 @@
+"""
+Background workers that keep slow work off the GUI thread
+"""
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+from core.optimizer import SystemOptimizer
+from utils.logger import get_logger
+
+
+class PoolRunnable(QRunnable):
+    """
+    QRunnable with a QThread-like start()/wait() interface
+
+    Subclasses set SIGNALS to a QObject subclass declaring their signals and
+    implement work(). Each declared signal is also reachable as an attribute
+    of the runnable, so callers connect to runnable.finished and friends.
+    """
+    SIGNALS = QObject
+
+    def __init__(self):
+        super().__init__()
+        # The Python owner keeps the runnable alive, not the pool
+        self.setAutoDelete(False)
+        self.signals = self.SIGNALS()
+        for name, attr in vars(self.SIGNALS).items():
+            if isinstance(attr, pyqtSignal):
+                setattr(self, name, getattr(self.signals, name))
+        self._done = threading.Event()
+        self._done.set()
+
+    def start(self):
+        """Queue the work on the global thread pool"""
+        self._done.clear()
+        QThreadPool.globalInstance().start(self)
+
+    def wait(self):
+        """Block until the work has finished (returns at once if never started)"""
+        self._done.wait()
+
+    def run(self):
+        """Pool entry point"""
+        try:
+            self.work()
+        finally:
+            self._done.set()
+
+    def work(self):
+        """Do the background work"""
+        raise NotImplementedError
+
+
+class ResourceWorker(QObject):
+    """
+    Polls system resources from a dedicated thread
+
+    Move it to a QThread and connect the thread's started signal to
+    start_timer(); each poll emits the ResourceStats through stats_ready.
+    """
+    stats_ready = pyqtSignal(object)
+
+    # Polling period (ms)
+    INTERVAL_MS = 2000
+    # Delay before the first sample, long enough for a meaningful CPU reading (ms)
+    FIRST_POLL_MS = 250
+
+    def __init__(self, optimizer: SystemOptimizer = None):
+        super().__init__()
+        # Kept across polls: CPU usage is measured between calls
+        self.optimizer = optimizer
+        self._timer = None
+
+    @pyqtSlot()
+    def start_timer(self):
+        """Start polling; must run on the worker thread"""
+        # Created here so the timer is owned by the worker thread
+        if self.optimizer is None:
+            self.optimizer = SystemOptimizer()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start(self.INTERVAL_MS)
+        QTimer.singleShot(self.FIRST_POLL_MS, self.poll)
+
+    @pyqtSlot()
+    def stop_timer(self):
+        """Stop polling; must run on the worker thread"""
+        if self._timer is not None:
+            self._timer.stop()
+
+    @pyqtSlot()
+    def poll(self):
+        """Sample resources once and publish them"""
+        try:
+            stats = self.optimizer.get_system_resources()
+        except Exception as e:
+            get_logger().error(f"Error polling system resources: {e}")
+            return
+        self.stats_ready.emit(stats)
@@ -5,10 +5,6 @@ Advanced System Cleaner and Optimizer
 import sys
 import os
 
-# Fix for PyQt5 slow GUI response - disable high DPI scaling
-# https://stackoverflow.com/questions/61755740/pyqt5-application-slow-gui-response-for-unknown-reasons
-os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
-
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
@@ -31,20 +27,29 @@ def main():
     # Initialize config
     config = get_config()
     
+    # Native high-DPI scaling: Qt renders at the screen's scale instead of
+    # software-resizing pixmaps on every repaint. Must precede QApplication.
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    if hasattr(QApplication, 'setHighDpiScaleFactorRoundingPolicy'):  # Qt 5.14+
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+    
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("PC Assistant")
     app.setOrganizationName("PC Assistant")
     
-    # Load stylesheet
+    # Load stylesheet (binary read: no newline translation). Applied before
+    # the window is shown, so it is polished once and never painted unstyled
     try:
         style_path = os.path.join(os.path.dirname(__file__), 'resources', 'styles.qss')
-        if os.path.exists(style_path):
-            with open(style_path, 'r', encoding='utf-8') as f:
-                app.setStyleSheet(f.read())
-            logger.info("Stylesheet loaded successfully")
-        else:
-            logger.warning(f"Stylesheet not found at {style_path}")
+        with open(style_path, 'rb') as f:
+            app.setStyleSheet(f.read().decode('utf-8'))
+        logger.info("Stylesheet loaded successfully")
+    except FileNotFoundError:
+        logger.warning(f"Stylesheet not found at {style_path}")
     except Exception as e:
         logger.error(f"Error loading stylesheet: {e}")
     
@@ -6,17 +6,46 @@ import ctypes
 import sys
 import os
 import platform
+from functools import lru_cache
 
 
 IS_WINDOWS = platform.system() == "Windows"
 
+# Resolved once; explicit prototype so ctypes does no per-call argument probing
+_IsUserAnAdmin = None
+if IS_WINDOWS:
+    try:
+        _IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
+        _IsUserAnAdmin.argtypes = []
+        _IsUserAnAdmin.restype = ctypes.c_int
+    except (AttributeError, OSError):
+        _IsUserAnAdmin = None
+
+
+# Shown when running without elevation
+_WARN_MESSAGE = (
+    "ƒsÿ‹÷? Attenzione: L'applicazione non Çù in esecuzione con privilegi di amministratore.\n"
+    "Alcune funzionalitÇÿ potrebbero non funzionare correttamente:\n"
+    "- Pulizia registro di Windows\n"
+    "- Disinstallazione software\n"
+    "- Accesso a file di sistema\n"
+    "- Modifica programmi di avvio\n\n"
+    "Si consiglia di riavviare come amministratore."
+)
+
 
+@lru_cache(maxsize=1)
 def is_admin():
-    """Check if the current process has administrator privileges"""
-    if not IS_WINDOWS:
+    """
+    Check if the current process has administrator privileges
+    
+    A process's elevation cannot change while it runs, so the answer is
+    computed once.
+    """
+    if _IsUserAnAdmin is None:
         return False
     try:
-        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        return bool(_IsUserAnAdmin())
     except Exception:
         return False
 
@@ -46,17 +75,5 @@ def request_admin():
 
 def check_admin_and_warn():
     """Check admin status and return warning message if not admin"""
-    if not IS_WINDOWS:
-        # UAC prompt not applicable outside Windows
-        return None
-    if not is_admin():
-        return (
-            "ƒsÿ‹÷? Attenzione: L'applicazione non Çù in esecuzione con privilegi di amministratore.\n"
-            "Alcune funzionalitÇÿ potrebbero non funzionare correttamente:\n"
-            "- Pulizia registro di Windows\n"
-            "- Disinstallazione software\n"
-            "- Accesso a file di sistema\n"
-            "- Modifica programmi di avvio\n\n"
-            "Si consiglia di riavviare come amministratore."
-        )
-    return None
+    # UAC prompt not applicable outside Windows
+    return None if not IS_WINDOWS or is_admin() else _WARN_MESSAGE
@@ -2,10 +2,29 @@
 Configuration manager for PC Assistant
 Handles loading and saving user preferences
 """
+import copy
 import json
 import os
 from typing import Any, Dict
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# orjson (optional package, C implementation) parses and serializes several
+# times faster than the stdlib json module; both accept bytes input
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+else:
+    _loads = json.loads
+    
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
 
 class Config:
     """Configuration manager"""
@@ -42,68 +61,115 @@ class Config:
         "ui": {
             "theme": "dark",
             "language": "it"
+        },
+        "logging": {
+            "rotation": "size",  # "size" or "daily"
+            "max_bytes": 100 * 1024 * 1024,
+            "backup_count": 3
         }
     }
     
     def __init__(self, config_file="config.json"):
         """Initialize configuration manager"""
         self.config_file = config_file
-        self.config = self._load_config()
+        # Loaded from disk on first access (see the config property)
+        self._config = None
+        # Every value (nested dicts included) by dot-notation key
+        self._flat: Dict[str, Any] = {}
+        # Hash of the text last written, to skip saving unchanged settings
+        self._saved_hash = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dict, read from the file the first time it is needed"""
+        if self._config is None:
+            self.config = self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+        self._flat = {}
+        self._index(value, '')
+    
+    def _index(self, value: Any, key: str):
+        """Add value and everything nested in it to the flat index under key"""
+        if key:
+            self._flat[key] = value
+        if isinstance(value, dict):
+            prefix = f"{key}." if key else ''
+            for k, v in value.items():
+                self._index(v, prefix + k)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                return self._merge_configs(self.DEFAULT_CONFIG, config)
-            except Exception as e:
-                print(f"Error loading config: {e}. Using defaults.")
-                return self.DEFAULT_CONFIG.copy()
-        else:
-            # Create default config file
-            self.save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+        """Load configuration from file, or the defaults if there is none"""
+        try:
+            with open(self.config_file, 'rb') as f:
+                config = _loads(f.read())
+            # Merge with defaults to ensure all keys exist
+            return self._merge_configs(self.DEFAULT_CONFIG, config)
+        except FileNotFoundError:
+            # The file is first written by save()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
+        except Exception as e:
+            print(f"Error loading config: {e}. Using defaults.")
+            return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def _merge_configs(self, default: Dict, user: Dict) -> Dict:
         """Merge user config with defaults"""
-        result = default.copy()
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        result = copy.deepcopy(default)
+        # Walk both trees together, updating the copy in place
+        stack = [(result, user)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
         return result
     
     def get(self, key: str, default=None) -> Any:
         """Get configuration value by dot-notation key"""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        if self._config is None:
+            self.config = self._load_config()
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value by dot-notation key"""
         keys = key.split('.')
         config = self.config
+        flat = self._flat
+        path = ''
         for k in keys[:-1]:
             if k not in config:
                 config[k] = {}
             config = config[k]
+            path = f"{path}.{k}" if path else k
+            flat[path] = config
         config[keys[-1]] = value
+        
+        # Drop whatever was indexed below the old value, then index the new one
+        prefix = key + '.'
+        for stale in [k for k in flat if k.startswith(prefix)]:
+            del flat[stale]
+        self._index(value, key)
     
     def save_config(self, config: Dict = None):
         """Save configuration to file"""
         if config is None:
             config = self.config
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            data = _dumps(config)
+            data_hash = hash(data)
+            if data_hash == self._saved_hash:
+                return
+            # Written aside and swapped in, so the file is never left half-written
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_hash = data_hash
         except Exception as e:
             print(f"Error saving config: {e}")
     
@@ -113,7 +179,7 @@ class Config:
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self.save()
 
 
@@ -2,10 +2,14 @@
 Logging system for PC Assistant
 Provides file and console logging with rotation
 """
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import (MemoryHandler, QueueHandler, QueueListener,
+                              RotatingFileHandler, TimedRotatingFileHandler)
 from datetime import datetime
+from utils.config import get_config
 
 
 class Logger:
@@ -16,7 +20,17 @@ class Logger:
         self.log_dir = log_dir
         self.log_file = log_file
         self.logger = None
+        self._queue = None
+        self._listener = None
         self._setup_logger()
+        
+        # Instance attributes shadow the wrapper methods below, so each call
+        # goes straight to the logging.Logger method
+        self.debug = self.logger.debug
+        self.info = self.logger.info
+        self.warning = self.logger.warning
+        self.error = self.logger.error
+        self.critical = self.logger.critical
     
     def _setup_logger(self):
         """Setup logging configuration"""
@@ -32,14 +46,27 @@ class Logger:
         if self.logger.handlers:
             return
         
-        # File handler with rotation (10MB max, 5 backups)
+        # File handler with rotation. Every rollover renames the backups and
+        # reopens the file, stalling the writes around it, so size-based
+        # rotation defaults to large files (100MB, 3 backups) to make it rare.
+        # "daily" rotates at midnight instead, whatever the size.
+        config = get_config()
         log_path = os.path.join(self.log_dir, self.log_file)
-        file_handler = RotatingFileHandler(
-            log_path,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
+        backup_count = config.get('logging.backup_count', 3)
+        if config.get('logging.rotation', 'size') == 'daily':
+            file_handler = TimedRotatingFileHandler(
+                log_path,
+                when='midnight',
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+        else:
+            file_handler = RotatingFileHandler(
+                log_path,
+                maxBytes=config.get('logging.max_bytes', 100 * 1024 * 1024),
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -54,9 +81,28 @@ class Logger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Buffer file records and write them in batches; errors flush at once
+        # so failures reach the file immediately
+        buffered_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        atexit.register(buffered_handler.flush)
+        
+        # Callers only enqueue records; a listener thread formats them and
+        # does the console and file I/O
+        self._queue = queue.Queue(-1)
+        self._listener = QueueListener(
+            self._queue, buffered_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        # Registered after the flush, so it runs first: drain, then flush
+        atexit.register(self._listener.stop)
+        
+        self.logger.addHandler(QueueHandler(self._queue))
     
     def debug(self, message):
         """Log debug message"""
@@ -3,19 +3,40 @@ File system scanner utilities
 Provides efficient file scanning with progress callbacks
 """
 import os
-from typing import List, Callable, Optional
+import re
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+# Compared and hashed by path only (see __hash__); repr left to object
+@dataclass(eq=False, repr=False, **_SLOTS)
 class FileInfo:
     """File information container"""
     path: str
     size: int
-    modified: datetime
+    mtime_ns: int  # st_mtime_ns; see modified
     is_dir: bool = False
     
+    @property
+    def modified(self) -> datetime:
+        """Modification time; built on access since most scans never read it"""
+        return datetime.fromtimestamp(self.mtime_ns / 1e9)
+    
+    @property
+    def mtime(self) -> float:
+        """Modification time in seconds, like st_mtime"""
+        return self.mtime_ns / 1e9
+    
     def __hash__(self):
         return hash(self.path)
 
@@ -23,129 +44,214 @@ class FileInfo:
 class Scanner:
     """File system scanner with progress tracking"""
     
+    # Files between progress callbacks
+    CALLBACK_EVERY = 256
+    
+    # Threads summing subdirectories in get_directory_size
+    SIZE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(self, excluded_paths: List[str] = None):
         """Initialize scanner with optional exclusions"""
         self.excluded_paths = excluded_paths or []
+        # Lowercased once, for the per-directory prefix test in _iter_scandir
+        self._excluded_lc = tuple(path.lower() for path in self.excluded_paths)
+        # All prefixes in one compiled pattern, matched case-insensitively
+        # without lowercasing every path first
+        self._excluded_re = re.compile(
+            "(?:" + "|".join(map(re.escape, self._excluded_lc)) + ")", re.IGNORECASE
+        ) if self._excluded_lc else None
         self.scanned_count = 0
         self.total_size = 0
     
     def is_excluded(self, path: str) -> bool:
         """Check if path should be excluded"""
-        path_lower = path.lower()
-        for excluded in self.excluded_paths:
-            if path_lower.startswith(excluded.lower()):
-                return True
-        return False
+        return self._excluded_re is not None and self._excluded_re.match(path) is not None
     
-    def scan_directory(
+    def iter_files(
         self,
         directory: str,
         recursive: bool = True,
         callback: Optional[Callable[[str, int], None]] = None
-    ) -> List[FileInfo]:
+    ) -> Iterator[FileInfo]:
         """
-        Scan directory and return list of files
+        Scan directory, yielding files as they are found
         
         Args:
             directory: Directory to scan
             recursive: Scan subdirectories
-            callback: Progress callback(current_file, count)
+            callback: Progress callback(current_file, count), called every
+                CALLBACK_EVERY files and once more for the last file
         
-        Returns:
-            List of FileInfo objects
+        Yields:
+            FileInfo objects
         """
-        files = []
         self.scanned_count = 0
         self.total_size = 0
+        next_callback_at = self.CALLBACK_EVERY
+        filepath = None
         
-        try:
-            if recursive:
-                for root, dirs, filenames in os.walk(directory):
-                    # Skip excluded directories
-                    if self.is_excluded(root):
-                        dirs.clear()  # Don't descend into subdirectories
-                        continue
-                    
-                    for filename in filenames:
-                        filepath = os.path.join(root, filename)
-                        
-                        if self.is_excluded(filepath):
-                            continue
-                        
+        for filepath, stat in self._iter_scandir(directory, recursive):
+            file_info = FileInfo(
+                path=filepath,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                is_dir=False
+            )
+            self.scanned_count += 1
+            self.total_size += stat.st_size
+            
+            if callback and self.scanned_count >= next_callback_at:
+                next_callback_at += self.CALLBACK_EVERY
+                callback(filepath, self.scanned_count)
+            
+            yield file_info
+        
+        if callback and filepath is not None and self.scanned_count % self.CALLBACK_EVERY:
+            callback(filepath, self.scanned_count)
+    
+    def _iter_scandir(self, directory: str, recursive: bool = True) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Yield (path, stat) for every file under directory, in os.walk order
+        
+        Paths come joined from the directory entries, and on Windows the stat
+        is served from the directory listing itself, so no file is looked up
+        twice. Like os.walk, symlinked directories are not descended into.
+        """
+        excluded = self._excluded_lc
+        is_excluded = self.is_excluded
+        stack = [directory]
+        while stack:
+            root = stack.pop()
+            # Skip excluded directories and everything below them
+            if is_excluded(root):
+                continue
+            root_lc = root.lower()
+            # With root itself not excluded, a file here can only match an
+            # exclusion that extends root's path; usually there is none
+            check_files = any(path.startswith(root_lc) for path in excluded)
+            
+            subdirs = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
                         try:
-                            stat = os.stat(filepath)
-                            file_info = FileInfo(
-                                path=filepath,
-                                size=stat.st_size,
-                                modified=datetime.fromtimestamp(stat.st_mtime),
-                                is_dir=False
-                            )
-                            files.append(file_info)
-                            self.scanned_count += 1
-                            self.total_size += stat.st_size
+                            if entry.is_dir():
+                                if recursive and not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                                continue
                             
-                            if callback:
-                                callback(filepath, self.scanned_count)
+                            filepath = entry.path
+                            if check_files and is_excluded(filepath):
+                                continue
+                            
+                            stat = entry.stat()
                         except (OSError, PermissionError):
                             # Skip files we can't access
                             continue
-            else:
-                # Non-recursive scan
-                for item in os.listdir(directory):
-                    filepath = os.path.join(directory, item)
-                    
-                    if self.is_excluded(filepath):
-                        continue
-                    
-                    try:
-                        stat = os.stat(filepath)
-                        if os.path.isfile(filepath):
-                            file_info = FileInfo(
-                                path=filepath,
-                                size=stat.st_size,
-                                modified=datetime.fromtimestamp(stat.st_mtime),
-                                is_dir=False
-                            )
-                            files.append(file_info)
-                            self.scanned_count += 1
-                            self.total_size += stat.st_size
-                            
-                            if callback:
-                                callback(filepath, self.scanned_count)
-                    except (OSError, PermissionError):
-                        continue
+                        
+                        yield filepath, stat
+            except (OSError, PermissionError):
+                continue
+            
+            # Reversed so the first subdirectory is walked next
+            stack.extend(reversed(subdirs))
+    
+    def scan_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        callback: Optional[Callable[[str, int], None]] = None
+    ) -> List[FileInfo]:
+        """
+        Scan directory and return list of files
         
-        except (OSError, PermissionError):
-            pass
+        Holds every FileInfo at once; prefer iter_files() when the files can
+        be processed as they are found.
         
-        return files
+        Args:
+            directory: Directory to scan
+            recursive: Scan subdirectories
+            callback: Progress callback(current_file, count)
+        
+        Returns:
+            List of FileInfo objects
+        """
+        return list(self.iter_files(directory, recursive, callback))
+    
+    def scan_directory_soa(
+        self,
+        directory: str,
+        recursive: bool = True
+    ) -> Tuple[List[str], array, array]:
+        """
+        Scan directory into parallel columns instead of FileInfo objects
+        
+        Sizes and mtimes are packed 8 bytes each, for bulk passes over many
+        files that would otherwise keep a FileInfo alive per file.
+        
+        Returns:
+            (paths, sizes as array('q'), mtime_ns as array('q')), index-aligned
+        """
+        paths = []
+        sizes = array('q')
+        mtimes = array('q')
+        add_path = paths.append
+        add_size = sizes.append
+        add_mtime = mtimes.append
+        for filepath, stat in self._iter_scandir(directory, recursive):
+            add_path(filepath)
+            add_size(stat.st_size)
+            add_mtime(stat.st_mtime_ns)
+        self.scanned_count = len(paths)
+        self.total_size = sum(sizes)
+        return paths, sizes, mtimes
     
     def get_directory_size(self, directory: str) -> int:
-        """Calculate total size of directory"""
+        """
+        Calculate total size of directory
+        
+        The top-level subdirectories are summed concurrently: the time goes
+        into stat calls, which release the GIL.
+        """
+        if self.is_excluded(directory):
+            return 0
+        
         total_size = 0
+        subdirs = []
         try:
-            for root, dirs, files in os.walk(directory):
-                if self.is_excluded(root):
-                    dirs.clear()
-                    continue
-                
-                for filename in files:
-                    filepath = os.path.join(root, filename)
-                    if not self.is_excluded(filepath):
-                        try:
-                            total_size += os.path.getsize(filepath)
-                        except (OSError, PermissionError):
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
                             continue
+                        if not self.is_excluded(entry.path):
+                            total_size += entry.stat().st_size
+                    except (OSError, PermissionError):
+                        continue
         except (OSError, PermissionError):
-            pass
+            return 0
+        
+        if subdirs:
+            workers = min(self.SIZE_WORKERS, len(subdirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                total_size += sum(executor.map(self._size_of_subtree, subdirs))
         
         return total_size
     
+    def _size_of_subtree(self, directory: str) -> int:
+        """Total size of the files under directory (safe to run concurrently)"""
+        return sum(stat.st_size for _, stat in self._iter_scandir(directory))
+    
     @staticmethod
+    @lru_cache(maxsize=8192)
     def format_size(size_bytes: int) -> str:
-        """Format bytes to human-readable size"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        """Format bytes to human-readable size (cached; sizes repeat a lot)"""
+        if size_bytes < 1024:
+            return f"{size_bytes:.2f} B"
+        # Each unit is 2**10 of the previous: the unit index is the bit length
+        # in steps of 10, and one division scales the value
+        index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
+